@@ -1,3 +1,12 @@
-from ade_bench.harness import BenchmarkResults, Harness
-
 __all__ = ["Harness", "BenchmarkResults"]
+
+
+def __getattr__(name):
+    # Defer the harness import graph (docker, boto3, agent SDKs) until a
+    # symbol is actually requested; importing subpackages like
+    # ade_bench.cli stays cheap
+    if name in __all__:
+        from ade_bench import harness
+
+        return getattr(harness, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,25 @@
-from ade_bench.agents.agent_factory import AgentFactory
-from ade_bench.agents.agent_name import AgentName
-from ade_bench.agents.base_agent import BaseAgent
-from ade_bench.agents.sage_agent import SageAgent
+# Each export lives in its own submodule; resolve them lazily so that
+# importing one name (e.g. AgentName for CLI validation) doesn't load
+# every agent implementation and its SDK
+_SUBMODULES = {
+    "AgentFactory": "agent_factory",
+    "AgentName": "agent_name",
+    "BaseAgent": "base_agent",
+    "SageAgent": "sage_agent",
+}
 
 __all__ = [
     "BaseAgent",
     "SageAgent",
     "AgentFactory",
     "AgentName",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(f"{__name__}.{submodule}"), name)
@@ -20,3 +20,8 @@ class AgentName(Enum):
             return "None"
         else:
             return model_name
+
+
+# Precomputed once for CLI help/error text so callers don't rebuild it
+# per invocation
+AGENT_CHOICES = ", ".join(a.value for a in AgentName)
@@ -7,10 +7,8 @@ import yaml
 from pathlib import Path
 from typing import Annotated
 
-from ade_bench.handlers.trial_handler import TrialHandler
-from ade_bench.terminal.docker_compose_manager import DockerComposeManager
 from ade_bench.utils.logger import logger
-from ade_bench.agents.agent_name import AgentName
+from ade_bench.agents.agent_name import AGENT_CHOICES, AgentName
 
 
 def interact(
@@ -300,7 +298,7 @@ def interact(
 
             except ValueError:
                 typer.echo(f"Warning: Unknown agent '{agent}', skipping agent setup")
-                typer.echo(f"Available agents: {', '.join([a.value for a in AgentName])}")
+                typer.echo(f"Available agents: {AGENT_CHOICES}")
 
         for script_path in trial_handler.task.test_script_paths:
             terminal.copy_to_container(
@@ -2,7 +2,6 @@
 
 import os
 import typer
-import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Set
@@ -10,9 +9,9 @@ from typing import List, Optional, Set
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
-from ade_bench import Harness
-from ade_bench.agents import AgentName
-from scripts_python.summarize_results import display_detailed_results
+# Import AgentName from its own module so the CLI doesn't pull in the
+# agent implementations just to validate --agent
+from ade_bench.agents.agent_name import AGENT_CHOICES, AgentName
 
 from ade_bench.cli.ab import migrate, check, tasks, view, save, interact as interact_module
 import click
@@ -21,6 +20,10 @@ from typer import rich_utils
 # Default tasks directory - can be overridden via environment variable
 DEFAULT_TASKS_DIR = Path(os.environ.get("ADE_TASKS_DIR", "tasks"))
 
+# Accepted --log-level values; validated against this static tuple instead
+# of probing the logging module per invocation
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
 # Store the original error formatter
 _original_rich_format_error = rich_utils.rich_format_error
 
@@ -105,7 +108,7 @@ def run(
     exclude_tasks: Optional[List[str]] = typer.Option(
         None,
         "--exclude-tasks",
-        help="Task IDs to exclude from the run"
+        help="Task IDs to exclude from the run, or a path to a text file with one task ID per line"
     ),
     n_attempts: int = typer.Option(
         1,
@@ -133,9 +136,9 @@ def run(
         help="Keep containers alive when tasks fail for debugging"
     ),
     run_id: str = typer.Option(
-        datetime.now().strftime("%Y-%m-%d__%H-%M-%S"),
+        None,
         "--run-id",
-        help="Unique identifier for this harness run"
+        help="Unique identifier for this harness run (default: current timestamp)"
     ),
     max_episodes: int = typer.Option(
         50,
@@ -174,8 +177,19 @@ def run(
     Example:
     ab run airbnb001 --db duckdb --project-type dbt --agent sage
     """
-    # Convert log level string to int
-    log_level_int = getattr(logging, log_level.upper(), logging.INFO)
+    # Compute the default run ID at invocation time, not at import time
+    if run_id is None:
+        run_id = datetime.now().strftime("%Y-%m-%d__%H-%M-%S")
+
+    # Validate and convert log level string to int
+    import logging
+
+    log_level = log_level.upper()
+    if log_level not in LOG_LEVELS:
+        typer.echo(f"Error: Invalid log level '{log_level}'")
+        typer.echo(f"Available levels: {', '.join(LOG_LEVELS)}")
+        raise typer.Exit(code=1)
+    log_level_int = getattr(logging, log_level)
 
     # Check for common mistakes in task_ids that look like flags
     flag_looking_args = [task for task in tasks if task.startswith("run-id") or task.startswith("--")]
@@ -197,9 +211,17 @@ def run(
         agent_name = AgentName(agent.lower())
     except ValueError:
         typer.echo(f"Error: Invalid agent name '{agent}'")
-        typer.echo(f"Available agents: {', '.join([a.value for a in AgentName])}")
+        typer.echo(f"Available agents: {AGENT_CHOICES}")
         raise typer.Exit(code=1)
 
+    # Normalize --exclude-tasks once, up front: a single value naming an
+    # existing file is read as one task ID per line
+    exclude_task_ids = None
+    if exclude_tasks:
+        if len(exclude_tasks) == 1 and Path(exclude_tasks[0]).is_file():
+            exclude_tasks = Path(exclude_tasks[0]).read_text().splitlines()
+        exclude_task_ids = frozenset(filter(None, map(str.strip, exclude_tasks))) or None
+
     # Setup path variables
     dataset_path = tasks_dir
     task_ids = tasks
@@ -214,6 +236,11 @@ def run(
     elif agent_args:
         agent_kwargs["additional_args"] = agent_args
 
+    # Import here so `ade --help` and argument errors skip the heavy
+    # harness import graph (docker, boto3, agent SDKs, ...)
+    from ade_bench import Harness
+    from scripts_python.summarize_results import display_detailed_results
+
     # Create and run the harness
     harness = Harness(
         dataset_path=dataset_path,
@@ -229,7 +256,7 @@ def run(
         max_episodes=max_episodes,
         upload_results=upload_results,
         n_concurrent_trials=n_concurrent_trials,
-        exclude_task_ids=set(exclude_tasks) if exclude_tasks else None,
+        exclude_task_ids=exclude_task_ids,
         n_attempts=n_attempts,
         create_seed=seed,
         disable_diffs=no_diffs,
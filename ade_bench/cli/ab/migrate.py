@@ -25,15 +25,20 @@ def duckdb_to_snowflake(
         "--use-database-export",
         help="Use database export for better performance"
     ),
+    workers: int = typer.Option(
+        4,
+        "--workers",
+        help="Number of databases to migrate in parallel"
+    ),
 ):
     """
     Migrate DuckDB databases to Snowflake.
     """
     # Import the migration script
     from scripts_python.migrate_duckdb_to_snowflake import main as migrate_main
-    
+
     # Call the migration function with the provided arguments
-    migrate_main(include, exclude, use_database_export)
+    migrate_main(include, exclude, use_database_export, workers=workers)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,11 @@ from typing import Optional, List
 app = typer.Typer(help="Manage ADE-bench runs")
 
 
+def _run_mtime(run_dir: Path) -> float:
+    """Sort key for run directories: modification time."""
+    return run_dir.stat().st_mtime
+
+
 @app.command()
 def list(
     limit: int = typer.Option(
@@ -33,7 +38,7 @@ def list(
     # Get all directories in the output path
     runs = sorted(
         [d for d in output_path.iterdir() if d.is_dir()], 
-        key=lambda d: d.stat().st_mtime, 
+        key=_run_mtime,
         reverse=True
     )
     
@@ -104,7 +109,7 @@ def open(
         # Get the most recent run
         runs = sorted(
             [d for d in output_path.iterdir() if d.is_dir()], 
-            key=lambda d: d.stat().st_mtime, 
+            key=_run_mtime,
             reverse=True
         )
         
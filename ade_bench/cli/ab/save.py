@@ -1,5 +1,6 @@
 """Commands for saving ADE-bench results."""
 
+import os
 import shutil
 import typer
 from pathlib import Path
@@ -46,9 +47,17 @@ def _save_run(run_path: Path, saved_dir: Path, force: bool = False) -> bool:
         # Remove existing directory
         shutil.rmtree(dest_path)
 
-    # Copy the experiment
+    # Copy the experiment. Hardlink the files when possible so saving a run
+    # costs O(files) instead of O(bytes); saved runs are read-only snapshots,
+    # so sharing the underlying data with experiments/ is safe.
     typer.echo(f"Copying {exp_name} to {saved_dir}/...")
-    shutil.copytree(run_path, dest_path)
+    try:
+        shutil.copytree(run_path, dest_path, copy_function=os.link)
+    except OSError:
+        # Hardlinks unavailable (e.g. saved_dir is on a different filesystem);
+        # fall back to a regular byte copy.
+        shutil.rmtree(dest_path, ignore_errors=True)
+        shutil.copytree(run_path, dest_path)
     typer.echo(f"Saved to {dest_path}")
     return True
 
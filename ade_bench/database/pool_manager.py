@@ -8,6 +8,8 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from ade_bench.utils import yaml_utils
+
 
 class DatabaseType(Enum):
     DUCKDB = "duckdb"
@@ -61,7 +63,7 @@ class DatabasePoolManager:
         """Load the database catalog from disk."""
         if self.catalog_path.exists():
             with open(self.catalog_path, "r") as f:
-                self._catalog = yaml.safe_load(f) or {"databases": {}}
+                self._catalog = yaml_utils.safe_load(f) or {"databases": {}}
         else:
             self._catalog = {"databases": {}}
 
@@ -5,12 +5,12 @@ from enum import Enum
 from importlib.resources import files
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import LiteralScalarString
 
 from ade_bench.parsers.parser_factory import ParserFactory
+from ade_bench.utils import yaml_utils
 from ade_bench.utils.logger import logger
 from ade_bench.harness_models import SolutionSeedConfig, VariantConfig
 from ade_bench.config import config
@@ -122,7 +122,7 @@ class Task(BaseModel):
 
     @classmethod
     def from_yaml(cls, path: Path) -> "Task":
-        data = yaml.safe_load(path.read_text())
+        data = yaml_utils.safe_load(path.read_text())
         try:
             return cls.model_validate(data)
         except:
@@ -58,7 +58,7 @@ class Harness:
         max_episodes: int = 50,
         upload_results: bool = False,
         n_concurrent_trials: int = 4,
-        exclude_task_ids: set[str] | None = None,
+        exclude_task_ids: frozenset[str] | None = None,
         n_attempts: int = 1,
         create_seed: bool = False,
         disable_diffs: bool = False,
@@ -161,7 +161,7 @@ class Harness:
 
     @property
     def _profiler_metadata_output_path(self) -> Path:
-        return self.profiler_output_path / "metatdata.json"
+        return self.profiler_output_path / "metadata.json"
 
     def _create_agent_for_task(self, task_id: str) -> BaseAgent:
         """Create a fresh agent for a specific task.
@@ -905,9 +905,9 @@ class Harness:
             self._logger.warning(f"task.yaml not found for {trial_handler.task_id}")
             return
 
-        import yaml
+        from ade_bench.utils import yaml_utils
         with open(task_yaml_path, 'r') as f:
-            task_config = yaml.safe_load(f)
+            task_config = yaml_utils.safe_load(f)
 
         # Extract table names from solution_seeds (all items are dictionaries)
         tables_to_extract = []
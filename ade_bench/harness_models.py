@@ -4,12 +4,12 @@ import uuid
 from enum import Enum
 from typing import Any, List, Optional
 from pathlib import Path
-import yaml
 import numpy as np
 from collections import defaultdict
 
 from pydantic import BaseModel, Field, computed_field
 from ade_bench.parsers.base_parser import UnitTestStatus
+from ade_bench.utils import yaml_utils
 
 
 class FailureMode(Enum):
@@ -57,7 +57,7 @@ class RunMetadata(BaseModel):
     cleanup: bool
     log_level: int
     task_ids: list[str] | None = None
-    exclude_task_ids: set[str] | None = None
+    exclude_task_ids: frozenset[str] | None = None
     n_concurrent_trials: int = 4
     n_attempts: int = 1
     max_episodes: int = 50
@@ -222,5 +222,5 @@ class TerminalCommand(BaseModel):
     @classmethod
     def from_yaml_list(cls, path: Path) -> list["TerminalCommand"]:
         """Load a list of terminal commands from a YAML file."""
-        data = yaml.safe_load(path.read_text())
+        data = yaml_utils.safe_load(path.read_text())
         return [cls.model_validate(obj) for obj in data]
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, Any, Tuple
 from .setup_utils import generate_task_snowflake_credentials, update_file_in_container
 from ..terminal.docker_compose_manager import DockerComposeManager
+from ..utils import yaml_utils
 
 def _update_snowflake_creds(path: str, project_name: str, task_id: str) -> None:
     """Update the profiles.yml file with task-specific Snowflake credentials."""
@@ -14,7 +15,7 @@ def _update_snowflake_creds(path: str, project_name: str, task_id: str) -> None:
     creds = generate_task_snowflake_credentials(task_id)
 
     with open(path) as f:
-        profiles = yaml.safe_load(f)
+        profiles = yaml_utils.safe_load(f)
 
     profiles[profile_name]['outputs']['dev']['account'] = creds['account'].replace('.snowflakecomputing.com', '')
     profiles[profile_name]['outputs']['dev']['user'] = creds['user']
@@ -32,7 +33,7 @@ def _update_project_profile(path: str, project_name: str, task_id: str) -> None:
     profile_name = f"{project_name}-snowflake"
 
     with open(path) as f:
-        profiles = yaml.safe_load(f)
+        profiles = yaml_utils.safe_load(f)
 
     profiles['profile'] = profile_name
 
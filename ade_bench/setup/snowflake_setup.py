@@ -16,15 +16,16 @@ except ImportError:
 
 
 def _execute_queries(cursor, queries: str, logger: logging.Logger):
-    """Execute multiple SQL queries separated by semicolons."""
-    for query in queries.split(";"):
-        query = query.strip()
-        if query:  # Skip empty queries
-            try:
-                cursor.execute(query)
-            except Exception as e:
-                logger.error(f"Error executing Snowflake query: {query[:100]}... - {e}")
-                raise
+    """Execute a multi-statement SQL batch in a single server round trip.
+
+    The statements are submitted together (num_statements=0 allows a
+    variable-length batch) instead of one network round trip per statement.
+    """
+    try:
+        cursor.execute(queries, num_statements=0)
+    except Exception as e:
+        logger.error(f"Error executing Snowflake query batch: {queries[:100]}... - {e}")
+        raise
 
 
 def _get_snowflake_connection():
@@ -49,41 +50,42 @@ def _get_snowflake_connection():
     conn = snowflake.connector.connect(
         account=account_id,
         user=user,
-        password=password
+        password=password,
+        # Allow variable-length multi-statement batches in _execute_queries
+        session_parameters={"MULTI_STATEMENT_COUNT": 0}
     )
 
     return conn
 
 
-def _clone_database(source_db: str, target_db: str, logger: logging.Logger) -> tuple[bool, Optional[str]]:
-    """Clone a Snowflake database.
-    
+def _clone_database(conn, source_db: str, target_db: str, logger: logging.Logger) -> tuple[bool, Optional[str]]:
+    """Clone a Snowflake database using an existing connection.
+
     Returns:
         Tuple of (success, error_message). error_message is None on success.
     """
     try:
-        with _get_snowflake_connection() as conn:
-            cursor = conn.cursor()
+        cursor = conn.cursor()
 
-            # Check if source database exists
-            check_source_query = f"SHOW DATABASES LIKE '{source_db}'"
-            cursor.execute(check_source_query)
-            source_exists = cursor.fetchone() is not None
+        # Check if source database exists
+        check_source_query = f"SHOW DATABASES LIKE '{source_db}'"
+        cursor.execute(check_source_query)
+        source_exists = cursor.fetchone() is not None
 
-            if not source_exists:
-                error_msg = f"Source database '{source_db}' does not exist. Run 'ade migrate duckdb-to-snowflake' first."
-                logger.error(error_msg)
-                return False, error_msg
+        if not source_exists:
+            error_msg = f"Source database '{source_db}' does not exist. Run 'ade migrate duckdb-to-snowflake' first."
+            logger.error(error_msg)
+            return False, error_msg
 
-            # Drop target database if it exists
-            drop_target_query = f"DROP DATABASE IF EXISTS {target_db}"
-            cursor.execute(drop_target_query)
+        # Drop target database if it exists
+        drop_target_query = f"DROP DATABASE IF EXISTS {target_db}"
+        cursor.execute(drop_target_query)
 
-            # Clone the database
-            clone_query = f"CREATE DATABASE {target_db} CLONE {source_db}"
-            cursor.execute(clone_query)
+        # Clone the database
+        clone_query = f"CREATE DATABASE {target_db} CLONE {source_db}"
+        cursor.execute(clone_query)
 
-            return True, None
+        return True, None
 
     except Exception as e:
         error_msg = f"Failed to clone database '{source_db}' to '{target_db}': {e}"
@@ -91,75 +93,74 @@ def _clone_database(source_db: str, target_db: str, logger: logging.Logger) -> t
         return False, error_msg
 
 
-def _create_user_and_role(creds: Dict[str, str], logger: logging.Logger) -> tuple[bool, Optional[str]]:
-    """Create user and role for the database.
-    
+def _create_user_and_role(conn, creds: Dict[str, str], logger: logging.Logger) -> tuple[bool, Optional[str]]:
+    """Create user and role for the database using an existing connection.
+
     Returns:
         Tuple of (success, error_message). error_message is None on success.
     """
     try:
-        with _get_snowflake_connection() as conn:
-            cursor = conn.cursor()
-
-            # Use the target database
-            use_db_query = f"USE DATABASE {creds['database']}"
-            cursor.execute(use_db_query)
-
-            # Drop and create role
-            admin_role = os.getenv('SNOWFLAKE_ROLE')
-            if not admin_role:
-                error_msg = "SNOWFLAKE_ROLE environment variable not set"
-                logger.error(error_msg)
-                return False, error_msg
-            
-            role_query = f"""
-                DROP ROLE IF EXISTS {creds['role']};
-                CREATE ROLE {creds['role']};
-                GRANT ROLE {creds['role']} TO ROLE {admin_role};
-            """
-            _execute_queries(cursor, role_query, logger)
-
-            # Create grants query template
-            grants_template = """
-                GRANT USAGE ON WAREHOUSE {warehouse} to {role};
-                GRANT USAGE ON DATABASE {database} TO ROLE {role};
-                GRANT CREATE SCHEMA ON DATABASE {database} TO ROLE {role};
-                GRANT CREATE TABLE ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role};
-                GRANT CREATE TABLE ON FUTURE SCHEMAS IN DATABASE {database} TO ROLE {role};
-                GRANT CREATE VIEW ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role};
-                GRANT CREATE VIEW ON FUTURE SCHEMAS IN DATABASE {database} TO ROLE {role};
-                GRANT USAGE, MODIFY ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role};
-                GRANT USAGE, MODIFY ON FUTURE SCHEMAS IN DATABASE {database} TO ROLE {role};
-                GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA {database}.PUBLIC TO ROLE {role};
-                GRANT SELECT, INSERT, UPDATE, DELETE ON FUTURE TABLES IN SCHEMA {database}.PUBLIC TO ROLE {role};
-                GRANT SELECT, INSERT, UPDATE, DELETE ON ALL VIEWS IN SCHEMA {database}.PUBLIC TO ROLE {role};
-                GRANT SELECT, INSERT, UPDATE, DELETE ON FUTURE VIEWS IN SCHEMA {database}.PUBLIC TO ROLE {role};
-                GRANT OWNERSHIP ON DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
-                GRANT OWNERSHIP ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
-                GRANT OWNERSHIP ON ALL TABLES IN DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
-                GRANT OWNERSHIP ON ALL VIEWS IN DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
-            """
-
-            # Grant privileges to task role
-            task_grants_query = grants_template.format(
-                warehouse=creds['warehouse'],
-                database=creds['database'],
-                role=creds['role']
-            )
-            _execute_queries(cursor, task_grants_query, logger)
-
-            # Drop and create user
-            user_query = f"""
-                DROP USER IF EXISTS {creds['user']};
-                CREATE USER {creds['user']}
-                PASSWORD = '{creds['password']}'
-                TYPE = LEGACY_SERVICE
-                DEFAULT_ROLE = {creds['role']};
-                GRANT ROLE {creds['role']} TO USER {creds['user']};
-            """
-            _execute_queries(cursor, user_query, logger)
-
-            return True, None
+        cursor = conn.cursor()
+
+        # Use the target database
+        use_db_query = f"USE DATABASE {creds['database']}"
+        cursor.execute(use_db_query)
+
+        # Drop and create role
+        admin_role = os.getenv('SNOWFLAKE_ROLE')
+        if not admin_role:
+            error_msg = "SNOWFLAKE_ROLE environment variable not set"
+            logger.error(error_msg)
+            return False, error_msg
+        
+        role_query = f"""
+            DROP ROLE IF EXISTS {creds['role']};
+            CREATE ROLE {creds['role']};
+            GRANT ROLE {creds['role']} TO ROLE {admin_role};
+        """
+        _execute_queries(cursor, role_query, logger)
+
+        # Create grants query template
+        grants_template = """
+            GRANT USAGE ON WAREHOUSE {warehouse} to {role};
+            GRANT USAGE ON DATABASE {database} TO ROLE {role};
+            GRANT CREATE SCHEMA ON DATABASE {database} TO ROLE {role};
+            GRANT CREATE TABLE ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role};
+            GRANT CREATE TABLE ON FUTURE SCHEMAS IN DATABASE {database} TO ROLE {role};
+            GRANT CREATE VIEW ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role};
+            GRANT CREATE VIEW ON FUTURE SCHEMAS IN DATABASE {database} TO ROLE {role};
+            GRANT USAGE, MODIFY ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role};
+            GRANT USAGE, MODIFY ON FUTURE SCHEMAS IN DATABASE {database} TO ROLE {role};
+            GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA {database}.PUBLIC TO ROLE {role};
+            GRANT SELECT, INSERT, UPDATE, DELETE ON FUTURE TABLES IN SCHEMA {database}.PUBLIC TO ROLE {role};
+            GRANT SELECT, INSERT, UPDATE, DELETE ON ALL VIEWS IN SCHEMA {database}.PUBLIC TO ROLE {role};
+            GRANT SELECT, INSERT, UPDATE, DELETE ON FUTURE VIEWS IN SCHEMA {database}.PUBLIC TO ROLE {role};
+            GRANT OWNERSHIP ON DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
+            GRANT OWNERSHIP ON ALL SCHEMAS IN DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
+            GRANT OWNERSHIP ON ALL TABLES IN DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
+            GRANT OWNERSHIP ON ALL VIEWS IN DATABASE {database} TO ROLE {role} COPY CURRENT GRANTS;
+        """
+
+        # Grant privileges to task role
+        task_grants_query = grants_template.format(
+            warehouse=creds['warehouse'],
+            database=creds['database'],
+            role=creds['role']
+        )
+        _execute_queries(cursor, task_grants_query, logger)
+
+        # Drop and create user
+        user_query = f"""
+            DROP USER IF EXISTS {creds['user']};
+            CREATE USER {creds['user']}
+            PASSWORD = '{creds['password']}'
+            TYPE = LEGACY_SERVICE
+            DEFAULT_ROLE = {creds['role']};
+            GRANT ROLE {creds['role']} TO USER {creds['user']};
+        """
+        _execute_queries(cursor, user_query, logger)
+
+        return True, None
 
     except Exception as e:
         error_msg = f"Failed to create user and role: {e}"
@@ -189,14 +190,26 @@ def setup_snowflake(terminal, session, task_id: str, variant: Dict[str, Any], tr
     source_db = variant.get('db_name')
     target_db = creds['database']
 
-    # Clone the database
-    success, error_msg = _clone_database(source_db, target_db, logger)
-    if not success:
+    # One connection for both phases; the auth handshake is the expensive
+    # part and there is no reason to pay it twice per task
+    try:
+        conn = _get_snowflake_connection()
+    except Exception as e:
+        error_msg = f"Failed to connect to Snowflake: {e}"
+        logger.error(error_msg)
         return False, error_msg
 
-    # Create user and role
-    success, error_msg = _create_user_and_role(creds, logger)
-    if not success:
-        return False, error_msg
-    
-    return True, None
+    try:
+        # Clone the database
+        success, error_msg = _clone_database(conn, source_db, target_db, logger)
+        if not success:
+            return False, error_msg
+
+        # Create user and role
+        success, error_msg = _create_user_and_role(conn, creds, logger)
+        if not success:
+            return False, error_msg
+
+        return True, None
+    finally:
+        conn.close()
@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import Iterator, Optional
-import yaml
+from ade_bench.utils import yaml_utils
 from ade_bench.utils.logger import logger
 
 
@@ -11,7 +11,7 @@ class Dataset:
         self,
         dataset_path: Path,
         task_ids: list[str] | None = None,
-        excluded_task_ids: set[str] | None = None,
+        excluded_task_ids: frozenset[str] | None = None,
     ):
         """Initialize the dataset.
 
@@ -22,7 +22,7 @@ class Dataset:
         """
         self._dataset_path = dataset_path
         self._requested_task_ids = task_ids
-        self._excluded_task_ids = excluded_task_ids or set()
+        self._excluded_task_ids = excluded_task_ids or frozenset()
         self._logger = logger.getChild(__name__)
         self._tasks: dict[str, tuple[Path, str]] = {}
 
@@ -86,7 +86,7 @@ class Dataset:
             raise FileNotFoundError(f"Experiment set file {experiment_set_file} does not exist")
 
         with open(experiment_set_file) as f:
-            experiment_data = yaml.safe_load(f)
+            experiment_data = yaml_utils.safe_load(f)
 
         # Get the task_ids from the experiment set
         task_ids = experiment_data.get("task_ids", [])
@@ -128,7 +128,7 @@ class Dataset:
 
         task_yaml_path = task_dir / "task.yaml"
         with open(task_yaml_path) as f:
-            task_data = yaml.safe_load(f)
+            task_data = yaml_utils.safe_load(f)
 
         # Only include tasks with status=ready if only_ready_tasks is True
         if only_ready_tasks and task_data.get("status") != "ready":
@@ -0,0 +1,21 @@
+"""YAML loading helpers."""
+
+import warnings
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # Pure-Python fallback is ~10x slower; surface it once so slow config
+    # parsing is explainable
+    from yaml import SafeLoader as _SafeLoader
+    warnings.warn(
+        "libyaml is not available; falling back to the pure-Python YAML "
+        "loader, which is much slower"
+    )
+
+
+def safe_load(stream):
+    """Drop-in for yaml.safe_load that uses the C loader when available."""
+    return yaml.load(stream, Loader=_SafeLoader)
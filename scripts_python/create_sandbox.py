@@ -6,11 +6,12 @@ Script to create a sandbox environment from a task.
 import os
 import sys
 import shutil
-import yaml
 import argparse
-import logging
 from pathlib import Path
 
+# yaml is imported lazily inside the functions that need it so --help and
+# argument errors don't pay for it
+
 # Add the project root to the Python path so we can import ade_bench modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -56,6 +57,8 @@ def wipe_sandbox_directory():
 
 def get_task_config(task_name):
     """Get the task configuration from task.yaml."""
+    import yaml
+
     task_yaml_path = Path("tasks") / task_name / "task.yaml"
 
     if not task_yaml_path.exists():
@@ -229,6 +232,8 @@ def copy_shared_scripts():
 
 def update_dbt_config(variant, task_name):
     """Update dbt_project.yml and profiles.yml files based on variant configuration."""
+    import yaml
+
     sandbox_dir = Path("dev/sandbox")
     project_name = variant['project_name']
     db_type = variant['db_type']
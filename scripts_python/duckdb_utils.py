@@ -6,22 +6,98 @@ This module provides common functionality for extracting data from DuckDB files,
 including schema analysis, file discovery, and data export capabilities.
 """
 
+import fnmatch
+import functools
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Set
 import duckdb
 
+# Mapping from DuckDB column types to their Snowflake equivalents.
+# Types with parameters (e.g. DECIMAL(10,2)) are handled in duckdb_type_to_snowflake.
+DUCKDB_TO_SNOWFLAKE_TYPES = {
+    "BOOLEAN": "BOOLEAN",
+    "TINYINT": "TINYINT",
+    "SMALLINT": "SMALLINT",
+    "INTEGER": "INTEGER",
+    "BIGINT": "BIGINT",
+    "HUGEINT": "NUMBER(38,0)",
+    "UTINYINT": "SMALLINT",
+    "USMALLINT": "INTEGER",
+    "UINTEGER": "BIGINT",
+    "UBIGINT": "NUMBER(38,0)",
+    "FLOAT": "FLOAT",
+    "REAL": "FLOAT",
+    "DOUBLE": "DOUBLE",
+    "VARCHAR": "VARCHAR",
+    "TEXT": "VARCHAR",
+    "BLOB": "BINARY",
+    "DATE": "DATE",
+    "TIME": "TIME",
+    "TIMESTAMP": "TIMESTAMP_NTZ",
+    "TIMESTAMP WITH TIME ZONE": "TIMESTAMP_TZ",
+    "UUID": "VARCHAR",
+    "JSON": "VARIANT",
+    "INTERVAL": "VARCHAR",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def duckdb_type_to_snowflake(duckdb_type: str) -> str:
+    """Map a DuckDB column type to the closest Snowflake type.
+
+    Memoized: a database has few distinct column types but the mapper runs
+    once per column, so repeat lookups skip the prefix checks entirely.
+    """
+    duckdb_type = duckdb_type.upper()
+
+    # DECIMAL(p,s) maps directly to NUMBER(p,s)
+    if duckdb_type.startswith("DECIMAL"):
+        return duckdb_type.replace("DECIMAL", "NUMBER", 1)
+
+    # Nested types load as semi-structured data in Snowflake
+    if duckdb_type.endswith("[]") or duckdb_type.startswith(("STRUCT", "MAP", "LIST")):
+        return "VARIANT"
+
+    return DUCKDB_TO_SNOWFLAKE_TYPES.get(duckdb_type, "VARCHAR")
+
+
+# Larger row groups than DuckDB's default (122,880 rows) produce fewer, bigger
+# Parquet chunks, which compress better and scan faster on the warehouse side
+PARQUET_ROW_GROUP_SIZE = 1_000_000
+
+# ZSTD level 3 is close to the ratio of higher levels at a fraction of the
+# CPU cost; the upload is network-bound, so cheap compression wins overall
+PARQUET_ZSTD_LEVEL = 3
+
+# Shared option string for Parquet exports (COPY TO and EXPORT DATABASE)
+PARQUET_EXPORT_OPTIONS = (
+    f"FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL {PARQUET_ZSTD_LEVEL}, "
+    f"ROW_GROUP_SIZE {PARQUET_ROW_GROUP_SIZE}"
+)
+
+# Tables estimated above this row count are exported as one Parquet file per
+# DuckDB thread so Snowflake's COPY INTO can load the pieces in parallel
+LARGE_TABLE_ROW_THRESHOLD = 5_000_000
+
+# Cap on individual Parquet file size for split exports; the warehouse
+# distributes COPY work per file, so a single huge file would serialize
+# ingest on one thread
+PARQUET_TARGET_FILE_SIZE = 256_000_000
+
 
 class DuckDBExtractor:
     """Shared utilities for DuckDB data extraction and analysis."""
 
-    def __init__(self, source_dir: str = None):
+    def __init__(self, source_dir: str = None, verbose: bool = False):
         """
         Initialize the DuckDB extractor.
 
         Args:
             source_dir: Path to directory containing DuckDB files. If None, uses default.
+            verbose: Print per-table progress messages during export.
         """
         if source_dir is None:
             # Default to shared/databases/duckdb relative to this script
@@ -30,27 +106,62 @@ class DuckDBExtractor:
             source_dir = os.path.join(project_root, "shared", "databases", "duckdb")
 
         self.source_dir = Path(source_dir).resolve()
+        self.verbose = verbose
         self.excluded_files: Set[str] = set()
+        self.last_excluded_count = 0
+        self._exclusion_regex = None
+        self._include_regex_cache: Dict[tuple, "re.Pattern"] = {}
 
     def add_exclusions(self, exclusion_list: List[str]):
         """Add files to exclusion list."""
         self.excluded_files.update(exclusion_list)
+        self._exclusion_regex = self._compile_patterns(self.excluded_files)
+
+    @staticmethod
+    def _compile_patterns(patterns) -> "re.Pattern | None":
+        """Compile substring patterns into a single alternation regex."""
+        if not patterns:
+            return None
+        return re.compile("|".join(re.escape(p) for p in sorted(patterns)))
+
+    def discover_duckdb_files(self, patterns: List[str] = None, include_list: List[str] = None, apply_filters: bool = False) -> List[Path]:
+        """Discover DuckDB files in the configured source directory.
 
-    def discover_duckdb_files(self, patterns: List[str] = None) -> List[Path]:
-        """Discover DuckDB files in the configured source directory."""
+        When apply_filters is set, include/exclude filtering happens inside
+        the directory scan so rejected files are never collected; the number
+        of rejected files is recorded in last_excluded_count.
+        """
         if patterns is None:
             patterns = ["*.duckdb", "*.db", "*.ddb"]
 
-        if not self.source_dir.exists():
+        # A single scandir pass is cheaper than one glob per pattern; each
+        # entry is matched against every pattern in one sweep
+        discovered_files = set()
+        self.last_excluded_count = 0
+        try:
+            with os.scandir(self.source_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if not any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns):
+                        continue
+
+                    file_path = self.source_dir / entry.name
+                    if apply_filters:
+                        if include_list:
+                            if not self.should_include_file(file_path, include_list):
+                                self.last_excluded_count += 1
+                                continue
+                        elif self.should_exclude_file(file_path):
+                            self.last_excluded_count += 1
+                            continue
+
+                    discovered_files.add(file_path)
+        except FileNotFoundError:
             print(f"Error: Source directory does not exist: {self.source_dir}", file=sys.stderr)
             return []
 
-        discovered_files = []
-        for pattern in patterns:
-            discovered_files.extend(self.source_dir.glob(pattern))
-
-        # Remove duplicates and sort
-        return sorted(set(discovered_files))
+        return sorted(discovered_files)
 
     def analyze_duckdb_schema(self, db_path: Path) -> Dict:
         """Analyze schema and tables in a DuckDB file."""
@@ -75,9 +186,29 @@ class DuckDBExtractor:
                     """, [schema_name]).fetchall()
 
                     if tables:
+                        table_entries = []
+                        for name, ttype in tables:
+                            # Get column names and types so callers can build DDL
+                            # without a round trip to the target warehouse
+                            columns = conn.execute("""
+                                SELECT column_name, data_type
+                                FROM information_schema.columns
+                                WHERE table_schema = ? AND table_name = ?
+                                ORDER BY ordinal_position
+                            """, [schema_name, name]).fetchall()
+
+                            table_entries.append({
+                                'name': name,
+                                'type': ttype,
+                                'columns': [
+                                    {'name': col_name, 'type': col_type}
+                                    for col_name, col_type in columns
+                                ]
+                            })
+
                         schema_info[schema_name] = {
-                            'tables': [{'name': name, 'type': ttype} for name, ttype in tables],
-                            'table_count': len(tables)
+                            'tables': table_entries,
+                            'table_count': len(table_entries)
                         }
 
                 return {
@@ -98,60 +229,61 @@ class DuckDBExtractor:
 
     def should_exclude_file(self, db_path: Path) -> bool:
         """Check if file should be excluded from processing."""
-        file_name = db_path.name
-        file_stem = db_path.stem
-
-        # Check exact filename and stem
-        if file_name in self.excluded_files or file_stem in self.excluded_files:
+        if self._exclusion_regex is None:
+            return False
+        # Exclusion lists usually name files exactly (with or without the
+        # extension); a set membership test settles those without running
+        # the regex, which remains for substring patterns
+        if db_path.name in self.excluded_files or db_path.stem in self.excluded_files:
             return True
-
-        # Check if any exclusion pattern matches
-        for exclusion in self.excluded_files:
-            if exclusion in file_name or exclusion in file_stem:
-                return True
-
-        return False
+        return self._exclusion_regex.search(db_path.name) is not None
 
     def should_include_file(self, db_path: Path, include_list: List[str]) -> bool:
         """Check if file should be included in processing."""
         if not include_list:
             return True  # If no include list, include all
 
-        file_name = db_path.name
-        file_stem = db_path.stem
+        key = tuple(include_list)
+        include_regex = self._include_regex_cache.get(key)
+        if include_regex is None:
+            include_regex = self._compile_patterns(include_list)
+            self._include_regex_cache[key] = include_regex
 
-        # Check exact filename and stem
-        if file_name in include_list or file_stem in include_list:
-            return True
-
-        # Check if any include pattern matches
-        for include_pattern in include_list:
-            if include_pattern in file_name or include_pattern in file_stem:
-                return True
-
-        return False
+        return include_regex.search(db_path.name) is not None
 
     def export_table_to_parquet(self, duckdb_path: Path, schema_name: str, table_name: str, output_path: Path) -> bool:
         """Export a single table from DuckDB to Parquet format using direct DuckDB export."""
         try:
             with duckdb.connect(str(duckdb_path), read_only=True) as conn:
-                # First check if table is empty
                 if schema_name == 'main':
-                    count_query = f'SELECT COUNT(*) FROM "{table_name}"'
+                    select_query = f'SELECT * FROM "{table_name}"'
                 else:
-                    count_query = f'SELECT COUNT(*) FROM {schema_name}."{table_name}"'
-
-                row_count = conn.execute(count_query).fetchone()[0]
-
-                # Use DuckDB's direct export to Parquet
-                if schema_name == 'main':
-                    export_query = f'COPY (SELECT * FROM "{table_name}") TO "{output_path}" (FORMAT PARQUET, COMPRESSION ZSTD)'
-                else:
-                    export_query = f'COPY (SELECT * FROM {schema_name}."{table_name}") TO "{output_path}" (FORMAT PARQUET, COMPRESSION ZSTD)'
-
-                conn.execute(export_query)
-
-                print(f"    ✅ Exported {table_name} ({row_count} rows) -> {output_path.name}")
+                    select_query = f'SELECT * FROM {schema_name}."{table_name}"'
+
+                # Estimate table size from catalog metadata (no table scan);
+                # large tables are split into one file per thread so the
+                # warehouse can load the pieces in parallel
+                est_row = conn.execute("""
+                    SELECT estimated_size FROM duckdb_tables()
+                    WHERE schema_name = ? AND table_name = ?
+                """, [schema_name, table_name]).fetchone()
+                estimated_rows = est_row[0] if est_row else 0
+
+                export_options = PARQUET_EXPORT_OPTIONS
+                if estimated_rows > LARGE_TABLE_ROW_THRESHOLD:
+                    # Writes a directory at output_path containing one Parquet
+                    # file per thread, each further split at the size cap
+                    export_options += f', PER_THREAD_OUTPUT TRUE, FILE_SIZE_BYTES {PARQUET_TARGET_FILE_SIZE}'
+
+                # Use DuckDB's direct export to Parquet; data streams from the
+                # table to the file without materializing rows in Python.
+                # COPY reports the number of rows written, so no separate
+                # COUNT(*) scan of the table is needed
+                export_query = f'COPY ({select_query}) TO "{output_path}" ({export_options})'
+                row_count = conn.execute(export_query).fetchone()[0]
+
+                if self.verbose:
+                    print(f"    ✅ Exported {table_name} ({row_count} rows) -> {output_path.name}")
                 return True
 
         except Exception as e:
@@ -200,11 +332,13 @@ class DuckDBExtractor:
 
         # Export each table to Parquet
         for schema_name, schema_info in analysis['schemas'].items():
-            print(f"  Processing schema '{schema_name}' with {schema_info['table_count']} tables...")
+            if self.verbose:
+                print(f"  Processing schema '{schema_name}' with {schema_info['table_count']} tables...")
 
             for table_info in schema_info['tables']:
                 table_name = table_info['name']
-                print(f"    Processing table: {table_name}")
+                if self.verbose:
+                    print(f"    Processing table: {table_name}")
 
                 # Create parquet file path
                 parquet_filename = f"{db_name}_{schema_name}_{table_name}.parquet"
@@ -247,14 +381,16 @@ class DuckDBExtractor:
                 db_parquet_dir.mkdir(exist_ok=True)
 
                 # Use DuckDB's EXPORT DATABASE command
-                export_query = f"EXPORT DATABASE '{db_parquet_dir}' (FORMAT PARQUET, COMPRESSION ZSTD);"
-                print(f"  Exporting entire database using: {export_query}")
+                export_query = f"EXPORT DATABASE '{db_parquet_dir}' ({PARQUET_EXPORT_OPTIONS});"
+                if self.verbose:
+                    print(f"  Exporting entire database using: {export_query}")
                 conn.execute(export_query)
 
                 # Count exported files
                 parquet_files = list(db_parquet_dir.glob("**/*.parquet"))
 
-                print(f"  ✅ Exported {len(parquet_files)} Parquet files to {db_parquet_dir}")
+                if self.verbose:
+                    print(f"  ✅ Exported {len(parquet_files)} Parquet files to {db_parquet_dir}")
 
                 return {
                     'success': True,
@@ -6,9 +6,43 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
-import pstats
+import marshal
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_SELECT_FUNCTION_ID = """
+    SELECT id FROM functions 
+    WHERE filename = ? AND line_number = ? AND function_name = ?
+"""
+
+_INSERT_FUNCTION = """
+    INSERT INTO functions (filename, line_number, function_name, module_name, is_builtin)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_FUNCTION_STATS = """
+    INSERT INTO function_stats
+    (run_id, function_id, call_count, primitive_call_count,
+     total_time, cumulative_time, time_per_call, cumulative_per_call, time_percentage)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CALL_RELATIONSHIP = """
+    INSERT INTO call_relationships
+    (run_id, caller_function_id, callee_function_id, call_count, total_time, cumulative_time)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TOP_LEVEL_FUNCTION = """
+    INSERT OR IGNORE INTO top_level_functions (run_id, function_id)
+    VALUES (?, ?)
+"""
+
 def generate_db_path(base_dir: str = "profiling") -> str:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     stats_dir = Path(base_dir) / "statistics" / timestamp
@@ -18,7 +52,12 @@ def generate_db_path(base_dir: str = "profiling") -> str:
 def create_database(db_path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
-    
+
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-200000")
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS profiling_runs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,6 +95,7 @@ def create_database(db_path: str) -> sqlite3.Connection:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_functions_name ON functions(function_name)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_functions_filename ON functions(filename)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_functions_module ON functions(module_name)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_functions_builtin_filename ON functions(is_builtin, filename)")
     
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS function_stats (
@@ -124,81 +164,84 @@ def parse_folder_timestamp(folder_name: str) -> Optional[datetime]:
 def check_file_exists(folder_path: Path, filename: str) -> bool:
     return (folder_path / filename).exists()
 
-def get_or_create_function(cursor: sqlite3.Cursor, func_tuple: tuple) -> int:
+def get_or_create_function(cursor: sqlite3.Cursor, func_tuple: tuple, func_cache: dict) -> int:
+    function_id = func_cache.get(func_tuple)
+    if function_id is not None:
+        return function_id
+
     filename, line_number, function_name = func_tuple
-    
+
     is_builtin = filename == '~'
     module_name = None
     if not is_builtin and filename:
         module_name = Path(filename).stem
-    
-    cursor.execute("""
-        SELECT id FROM functions 
-        WHERE filename = ? AND line_number = ? AND function_name = ?
-    """, (filename, line_number, function_name))
-    
+
+    cursor.execute(_SELECT_FUNCTION_ID, (filename, line_number, function_name))
+
     row = cursor.fetchone()
     if row:
-        return row[0]
-    
-    cursor.execute("""
-        INSERT INTO functions (filename, line_number, function_name, module_name, is_builtin)
-        VALUES (?, ?, ?, ?, ?)
-    """, (filename, line_number, function_name, module_name, is_builtin))
-    
-    return cursor.lastrowid
+        function_id = row[0]
+    else:
+        cursor.execute(_INSERT_FUNCTION, (filename, line_number, function_name, module_name, is_builtin))
+        function_id = cursor.lastrowid
 
-def import_cprofile_data(cursor: sqlite3.Cursor, run_id: int, prof_path: Path):
+    func_cache[func_tuple] = function_id
+    return function_id
+
+def import_cprofile_data(cursor: sqlite3.Cursor, run_id: int, prof_path: Path, func_cache: dict):
     if not prof_path.exists():
         return
     
-    stats = pstats.Stats(str(prof_path))
-    
+    with open(prof_path, 'rb') as f:
+        raw_stats = marshal.load(f)
+
+    total_calls = 0
+    prim_calls = 0
+    total_tt = 0.0
+    top_level = []
+    for func_tuple, (cc, nc, tt, ct, callers) in raw_stats.items():
+        total_calls += nc
+        prim_calls += cc
+        total_tt += tt
+        if ("jprofile", 0, "profiler") in callers:
+            top_level.append(func_tuple)
+
     cursor.execute("""
         UPDATE profiling_runs
         SET total_function_calls = ?,
             primitive_calls = ?,
             total_time_seconds = ?
         WHERE id = ?
-    """, (stats.total_calls, stats.prim_calls, stats.total_tt, run_id))
+    """, (total_calls, prim_calls, total_tt, run_id))
     
-    for func_tuple, (cc, nc, tt, ct, callers) in stats.stats.items():
-        function_id = get_or_create_function(cursor, func_tuple)
-        
+    stats_rows = []
+    edge_rows = []
+
+    for func_tuple, (cc, nc, tt, ct, callers) in raw_stats.items():
+        function_id = get_or_create_function(cursor, func_tuple, func_cache)
+
         time_per_call = tt / nc if nc > 0 else 0
         cumulative_per_call = ct / cc if cc > 0 else 0
-        time_percentage = (tt / stats.total_tt * 100) if stats.total_tt > 0 else 0
-        
-        cursor.execute("""
-            INSERT INTO function_stats 
-            (run_id, function_id, call_count, primitive_call_count, 
-             total_time, cumulative_time, time_per_call, cumulative_per_call, time_percentage)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (run_id, function_id, nc, cc, tt, ct, time_per_call, cumulative_per_call, time_percentage))
-        
+        time_percentage = (tt / total_tt * 100) if total_tt > 0 else 0
+
+        stats_rows.append((run_id, function_id, nc, cc, tt, ct, time_per_call, cumulative_per_call, time_percentage))
+
         for caller_tuple, caller_stats in callers.items():
-            caller_function_id = get_or_create_function(cursor, caller_tuple)
-            
+            caller_function_id = get_or_create_function(cursor, caller_tuple, func_cache)
+
             if isinstance(caller_stats, tuple):
                 caller_nc, caller_cc, caller_tt, caller_ct = caller_stats
-                cursor.execute("""
-                    INSERT INTO call_relationships 
-                    (run_id, caller_function_id, callee_function_id, call_count, total_time, cumulative_time)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (run_id, caller_function_id, function_id, caller_nc, caller_tt, caller_ct))
+                edge_rows.append((run_id, caller_function_id, function_id, caller_nc, caller_tt, caller_ct))
             else:
-                cursor.execute("""
-                    INSERT INTO call_relationships 
-                    (run_id, caller_function_id, callee_function_id, call_count, total_time, cumulative_time)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (run_id, caller_function_id, function_id, caller_stats, None, None))
-    
-    for func_tuple in stats.top_level:
-        function_id = get_or_create_function(cursor, func_tuple)
-        cursor.execute("""
-            INSERT OR IGNORE INTO top_level_functions (run_id, function_id)
-            VALUES (?, ?)
-        """, (run_id, function_id))
+                edge_rows.append((run_id, caller_function_id, function_id, caller_stats, None, None))
+
+    cursor.executemany(_INSERT_FUNCTION_STATS, stats_rows)
+
+    cursor.executemany(_INSERT_CALL_RELATIONSHIP, edge_rows)
+
+    top_level_rows = [(run_id, get_or_create_function(cursor, func_tuple, func_cache))
+                      for func_tuple in top_level]
+    cursor.executemany(_INSERT_TOP_LEVEL_FUNCTION, top_level_rows)
 
 def import_metadata(summaries_dir: str = "profiling/summaries", base_dir: str = "profiling") -> str:
     summaries_path = Path(summaries_dir)
@@ -212,21 +255,25 @@ def import_metadata(summaries_dir: str = "profiling/summaries", base_dir: str =
     
     imported_count = 0
     skipped_count = 0
-    
+    func_cache = {}
+
     folders = sorted([f for f in summaries_path.iterdir() if f.is_dir()])
     
     for folder in tqdm(folders, desc="Processing folders"):
         folder_name = folder.name
-        metadata_file = folder / "metatdata.json"
-        
+        metadata_file = folder / "metadata.json"
+        if not metadata_file.exists():
+            # Older summaries were written with a misspelled filename
+            metadata_file = folder / "metatdata.json"
+
         if not metadata_file.exists():
             skipped_count += 1
             continue
-        
+
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-        except json.JSONDecodeError:
+            raw = metadata_file.read_bytes()
+            metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
             skipped_count += 1
             continue
         
@@ -257,7 +304,7 @@ def import_metadata(summaries_dir: str = "profiling/summaries", base_dir: str =
             
             if cprofile_exists:
                 prof_path = folder / "cProfile.prof"
-                import_cprofile_data(cursor, run_id, prof_path)
+                import_cprofile_data(cursor, run_id, prof_path, func_cache)
             
             imported_count += 1
             
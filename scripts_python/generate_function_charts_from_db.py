@@ -1,29 +1,61 @@
 #!/usr/bin/env python3
 import sys
+import os
 import sqlite3
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from scipy import stats as scipy_stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error, r2_score
 from tqdm import tqdm
 
+CHART_DPI = 100
+SCATTER_DOWNSAMPLE_THRESHOLD = 10_000
+
+PROJECT_FUNCTION_FILTER = """
+    f.is_builtin = 0
+    AND f.filename IS NOT NULL
+    AND f.filename != ''
+    AND f.filename != '~'
+    AND f.filename NOT LIKE '%site-packages%'
+    AND f.filename NOT LIKE '%/lib/%'
+    AND f.filename NOT LIKE '%/lib64/%'
+"""
+
+_CHART_FIG = None
+_CHART_AX = None
+_CHART_PID = None
+
+def _get_chart_axes():
+    global _CHART_FIG, _CHART_AX, _CHART_PID
+    if _CHART_FIG is None or _CHART_PID != os.getpid():
+        _CHART_FIG, _CHART_AX = plt.subplots(figsize=(10, 6))
+        _CHART_PID = os.getpid()
+    _CHART_AX.clear()
+    return _CHART_FIG, _CHART_AX
+
 def create_histogram(data: np.ndarray, title: str, xlabel: str, output_path: Path):
     if len(data) == 0:
         return
     
-    mean_val = np.mean(data)
-    std_val = np.std(data)
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
+    n = len(data)
+    total = data.sum()
+    mean_val = total / n
+    std_val = np.sqrt(max(0.0, data.dot(data) / n - mean_val * mean_val))
     
-    counts, bins, patches = ax.hist(data, bins=24, alpha=0.7, color='blue', edgecolor='black')
+    fig, ax = _get_chart_axes()
     
+    counts, edges = np.histogram(data, bins=24)
+    bin_width = edges[1] - edges[0]
+    centers = (edges[:-1] + edges[1:]) / 2
+    ax.bar(centers, counts, width=bin_width, alpha=0.7, color='blue', edgecolor='black')
+
     if std_val > 1e-10 and data.max() > data.min():
         x = np.linspace(data.min(), data.max(), 100)
-        normal_curve = scipy_stats.norm.pdf(x, mean_val, std_val) * len(data) * (bins[1] - bins[0])
+        normal_curve = scipy_stats.norm.pdf(x, mean_val, std_val) * len(data) * bin_width
         ax.plot(x, normal_curve, 'g-', linewidth=2, label='Normal Distribution')
     
     ax.axvline(mean_val, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.2f}')
@@ -40,29 +72,39 @@ def create_histogram(data: np.ndarray, title: str, xlabel: str, output_path: Pat
     ax.legend(title=f'μ={mean_val:.2f}, σ={std_val:.2f}')
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=CHART_DPI)
 
 def create_scatterplot(x_data: np.ndarray, y_data: np.ndarray, title: str, 
                        xlabel: str, ylabel: str, output_path: Path):
     if len(x_data) == 0 or len(y_data) == 0:
         return
     
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    ax.scatter(x_data, y_data, alpha=0.6, color='blue', edgecolors='black')
-    
-    X = x_data.reshape(-1, 1)
-    model = LinearRegression()
-    model.fit(X, y_data)
-    y_pred = model.predict(X)
-    
-    slope = model.coef_[0]
-    r2 = r2_score(y_data, y_pred)
-    mse = mean_squared_error(y_data, y_pred)
+    fig, ax = _get_chart_axes()
+    
+    if len(x_data) > SCATTER_DOWNSAMPLE_THRESHOLD:
+        counts, x_edges, y_edges = np.histogram2d(x_data, y_data, bins=(256, 256))
+        ax.imshow(counts.T, origin='lower',
+                  extent=[x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]],
+                  aspect='auto', cmap='Blues')
+    else:
+        ax.scatter(x_data, y_data, alpha=0.6, color='blue', edgecolors='black')
+    
+    x_mean = x_data.mean()
+    y_mean = y_data.mean()
+    x_centered = x_data - x_mean
+    var_x = (x_centered ** 2).sum()
+    slope = (x_centered * (y_data - y_mean)).sum() / var_x if var_x > 0 else 0.0
+    intercept = y_mean - slope * x_mean
+    y_pred = slope * x_data + intercept
+
+    ss_res = ((y_data - y_pred) ** 2).sum()
+    ss_tot = ((y_data - y_mean) ** 2).sum()
+    r2 = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
+    mse = ss_res / len(x_data)
     
-    ax.plot(x_data, y_pred, color='lightblue', linewidth=2, 
+    line_x = np.array([x_data.min(), x_data.max()])
+    ax.plot(line_x, slope * line_x + intercept, color='lightblue', linewidth=2,
             label=f'Slope={slope:.4f}, R²={r2:.4f}, MSE={mse:.4f}')
     
     ax.set_xlabel(xlabel)
@@ -71,9 +113,8 @@ def create_scatterplot(x_data: np.ndarray, y_data: np.ndarray, title: str,
     ax.legend()
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=CHART_DPI)
 
 def generate_base_charts(conn: sqlite3.Connection, output_dir: Path, pbar: tqdm):
     cursor = conn.cursor()
@@ -88,7 +129,7 @@ def generate_base_charts(conn: sqlite3.Connection, output_dir: Path, pbar: tqdm)
     for column, xlabel, filename in charts:
         pbar.set_postfix_str(f"Base histogram: {column}")
         cursor.execute(f"SELECT {column} FROM profiling_runs WHERE {column} IS NOT NULL")
-        data = np.array([row[0] for row in cursor.fetchall()])
+        data = np.fromiter((row[0] for row in cursor), dtype=np.float64)
         if len(data) > 0:
             create_histogram(data, 
                             f'Distribution of {xlabel}',
@@ -118,96 +159,93 @@ def generate_base_charts(conn: sqlite3.Connection, output_dir: Path, pbar: tqdm)
             FROM profiling_runs 
             WHERE {y_col} IS NOT NULL AND {x_col} IS NOT NULL
         """)
-        data = cursor.fetchall()
-        if len(data) > 0:
-            y_data = np.array([row[0] for row in data])
-            x_data = np.array([row[1] for row in data])
-            create_scatterplot(x_data, y_data, title, xlabel, ylabel, output_dir / filename)
+        flat = np.fromiter((value for row in cursor for value in row), dtype=np.float64)
+        if flat.size > 0:
+            data = flat.reshape(-1, 2)
+            create_scatterplot(data[:, 1], data[:, 0], title, xlabel, ylabel, output_dir / filename)
         pbar.update(1)
 
+def _render_function_charts(task):
+    func_name, call_counts, prim_counts, cumulative_times, func_dir = task
+    func_dir = Path(func_dir)
+
+    create_histogram(call_counts,
+                   f'Call Count Distribution - {func_name}',
+                   'Call Count',
+                   func_dir / 'hist_call_count.png')
+
+    create_histogram(prim_counts,
+                   f'Primitive Call Count Distribution - {func_name}',
+                   'Primitive Call Count',
+                   func_dir / 'hist_primitive_call_count.png')
+
+    create_histogram(cumulative_times,
+                   f'Cumulative Time Distribution - {func_name}',
+                   'Cumulative Time (seconds)',
+                   func_dir / 'hist_cumulative_time.png')
+
+    create_scatterplot(call_counts, cumulative_times,
+                     f'Cumulative Time vs Call Count - {func_name}',
+                     'Call Count',
+                     'Cumulative Time (seconds)',
+                     func_dir / 'scatter_cumtime_by_callcount.png')
+
+    create_scatterplot(prim_counts, cumulative_times,
+                     f'Cumulative Time vs Primitive Call Count - {func_name}',
+                     'Primitive Call Count',
+                     'Cumulative Time (seconds)',
+                     func_dir / 'scatter_cumtime_by_primcallcount.png')
+
+
 def generate_function_charts(conn: sqlite3.Connection, output_dir: Path, pbar: tqdm):
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT DISTINCT f.function_name, f.module_name, f.id, f.is_builtin, f.filename
+    cursor.execute(f"""
+        SELECT DISTINCT f.function_name, f.module_name, f.id
         FROM functions f
         JOIN function_stats fs ON f.id = fs.function_id
-        WHERE f.is_builtin = 0
+        WHERE {PROJECT_FUNCTION_FILTER}
     """)
+
+    project_functions = cursor.fetchall()
     
-    functions = cursor.fetchall()
-    
-    project_functions = []
-    for func_name, module_name, func_id, is_builtin, filename in functions:
-        if is_builtin or not filename or filename == '~':
-            continue
-        if 'site-packages' in filename or '/lib/' in filename or '/lib64/' in filename:
-            continue
-        project_functions.append((func_name, module_name, func_id))
-    
+    cursor.execute("""
+        SELECT function_id, call_count, primitive_call_count, cumulative_time
+        FROM function_stats
+        ORDER BY function_id
+    """)
+    stats = np.fromiter((value for row in cursor for value in row),
+                        dtype=np.float64).reshape(-1, 4)
+
+    stats_by_function = {}
+    if len(stats) > 0:
+        function_ids = stats[:, 0].astype(np.int64)
+        split_points = np.nonzero(np.diff(function_ids))[0] + 1
+        for group in np.split(stats, split_points):
+            stats_by_function[int(group[0, 0])] = group
+
+    functions_dir = output_dir / 'functions'
+    functions_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
     for func_name, module_name, func_id in project_functions:
-        pbar.set_postfix_str(f"Function: {module_name or 'unknown'}_{func_name[:30]}")
+        group = stats_by_function.get(func_id)
+        if group is None:
+            pbar.update(1)
+            continue
+
         safe_func_name = func_name.replace('/', '_').replace('<', '').replace('>', '').replace(':', '_')
         safe_module_name = (module_name or 'unknown').replace('/', '_').replace('<', '').replace('>', '').replace(':', '_')
-        
-        func_dir = output_dir / 'functions' / f'{safe_module_name}_{safe_func_name}'
-        func_dir.mkdir(parents=True, exist_ok=True)
-        
-        cursor.execute("SELECT call_count FROM function_stats WHERE function_id = ?", (func_id,))
-        call_counts = np.array([row[0] for row in cursor.fetchall()])
-        if len(call_counts) > 0:
-            create_histogram(call_counts,
-                           f'Call Count Distribution - {func_name}',
-                           'Call Count',
-                           func_dir / 'hist_call_count.png')
-        
-        cursor.execute("SELECT primitive_call_count FROM function_stats WHERE function_id = ?", (func_id,))
-        prim_counts = np.array([row[0] for row in cursor.fetchall()])
-        if len(prim_counts) > 0:
-            create_histogram(prim_counts,
-                           f'Primitive Call Count Distribution - {func_name}',
-                           'Primitive Call Count',
-                           func_dir / 'hist_primitive_call_count.png')
-        
-        cursor.execute("SELECT cumulative_time FROM function_stats WHERE function_id = ?", (func_id,))
-        cumulative_times = np.array([row[0] for row in cursor.fetchall()])
-        if len(cumulative_times) > 0:
-            create_histogram(cumulative_times,
-                           f'Cumulative Time Distribution - {func_name}',
-                           'Cumulative Time (seconds)',
-                           func_dir / 'hist_cumulative_time.png')
-        
-        cursor.execute("""
-            SELECT cumulative_time, call_count 
-            FROM function_stats 
-            WHERE function_id = ?
-        """, (func_id,))
-        data = cursor.fetchall()
-        if len(data) > 0:
-            times = np.array([row[0] for row in data])
-            counts = np.array([row[1] for row in data])
-            create_scatterplot(counts, times,
-                             f'Cumulative Time vs Call Count - {func_name}',
-                             'Call Count',
-                             'Cumulative Time (seconds)',
-                             func_dir / 'scatter_cumtime_by_callcount.png')
-        
-        cursor.execute("""
-            SELECT cumulative_time, primitive_call_count 
-            FROM function_stats 
-            WHERE function_id = ?
-        """, (func_id,))
-        data = cursor.fetchall()
-        if len(data) > 0:
-            times = np.array([row[0] for row in data])
-            prim_counts = np.array([row[1] for row in data])
-            create_scatterplot(prim_counts, times,
-                             f'Cumulative Time vs Primitive Call Count - {func_name}',
-                             'Primitive Call Count',
-                             'Cumulative Time (seconds)',
-                             func_dir / 'scatter_cumtime_by_primcallcount.png')
-        
-        pbar.update(1)
+
+        func_dir = functions_dir / f'{safe_module_name}_{safe_func_name}'
+        func_dir.mkdir(exist_ok=True)
+
+        tasks.append((func_name, group[:, 1], group[:, 2], group[:, 3], str(func_dir)))
+
+    pbar.set_postfix_str("Rendering function charts")
+    with ProcessPoolExecutor() as pool:
+        for _ in pool.map(_render_function_charts, tasks):
+            pbar.update(1)
 
 def generate_charts_from_database(db_path: str):
     db_file = Path(db_path)
@@ -219,16 +257,12 @@ def generate_charts_from_database(db_path: str):
     output_dir = db_file.parent
     
     cursor = conn.cursor()
-    cursor.execute("""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_functions_builtin_filename ON functions(is_builtin, filename)")
+    cursor.execute(f"""
         SELECT COUNT(DISTINCT f.id)
         FROM functions f
         JOIN function_stats fs ON f.id = fs.function_id
-        WHERE f.is_builtin = 0 
-        AND f.filename IS NOT NULL 
-        AND f.filename != '~'
-        AND f.filename NOT LIKE '%site-packages%'
-        AND f.filename NOT LIKE '%/lib/%'
-        AND f.filename NOT LIKE '%/lib64/%'
+        WHERE {PROJECT_FUNCTION_FILTER}
     """)
     num_functions = cursor.fetchone()[0]
     
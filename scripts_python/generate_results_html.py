@@ -16,6 +16,17 @@ from scripts_python.render_file_diffs import render_diff_log_html
 from scripts_python.summarize_results import generate_html_table
 from ade_bench.harness_models import BenchmarkResults
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file from bytes, via orjson when available."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 class ResultsHTMLGenerator:
     """Generates HTML dashboard for experiment results."""
@@ -55,13 +66,11 @@ class ResultsHTMLGenerator:
             return None
 
         try:
-            with open(results_path, 'r') as f:
-                results_data = json.load(f)
+            results_data = _load_json(results_path)
 
             metadata = {}
             if metadata_path.exists():
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
+                metadata = _load_json(metadata_path)
 
             # Process results into a more usable format
             tasks = []
@@ -290,8 +299,7 @@ class ResultsHTMLGenerator:
         content = ""
 
         if results_path.exists():
-            with open(results_path, 'r') as f:
-                results_data = json.load(f)
+            results_data = _load_json(results_path)
             content = json.dumps(results_data, indent=2)
         else:
             content = "No results.json file found."
@@ -348,9 +356,9 @@ class ResultsHTMLGenerator:
             # Try to generate HTML diff
             try:
                 html_content = render_diff_log_html(diff_log_path, task_data['task_id'])
-                # Write the HTML content directly to our task directory
-                with open(task_html_dir / "diffs.html", 'w') as f:
-                    f.write(html_content)
+                # Write the HTML content directly to our task directory;
+                # encode once instead of text-mode chunked encoding
+                (task_html_dir / "diffs.html").write_bytes(html_content.encode('utf-8'))
                 return  # We've created the diffs.html file directly
             except Exception as e:
                 print(f"Warning: Could not generate HTML diff: {e}")
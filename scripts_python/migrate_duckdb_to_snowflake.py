@@ -20,63 +20,220 @@ Requirements:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import importlib.util
+import json
 import os
+import threading
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
-try:
-    import snowflake.connector
-    SNOWFLAKE_AVAILABLE = True
-except ImportError:
-    SNOWFLAKE_AVAILABLE = False
-    snowflake = None
+def _snowflake_available() -> bool:
+    """Check for snowflake-connector-python without importing it.
+
+    The connector pulls in pyarrow and cryptography, which costs hundreds
+    of milliseconds at import; the real import is deferred to
+    get_snowflake_connection() so --help and dry runs stay fast.
+    """
+    return importlib.util.find_spec("snowflake.connector") is not None
 
 try:
-    from .duckdb_utils import DuckDBExtractor
+    from .duckdb_utils import DuckDBExtractor, duckdb_type_to_snowflake
 except ImportError:
-    from duckdb_utils import DuckDBExtractor
+    from duckdb_utils import DuckDBExtractor, duckdb_type_to_snowflake
 
 # Configuration - modify these paths as needed
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SNOWFLAKE_OUTPUT_DIR = os.path.join(PROJECT_ROOT, "shared", "databases", "snowflake")
 
+# Column index of rows_loaded in a COPY INTO result row
+# (file, status, rows_parsed, rows_loaded, ...)
+COPY_ROWS_LOADED_IDX = 3
+
+# Shared PUT options: 16 concurrent upload threads (the connector defaults
+# to 4), no existence check, and no gzip re-wrap of already-ZSTD Parquet
+PUT_OPTIONS = "PARALLEL=16 AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a Snowflake identifier, upper-casing to match unquoted folding.
+
+    Quoting protects reserved words and unusual characters; upper-casing
+    keeps the effective identifier the same as the unquoted form so other
+    tooling (e.g. the task setup's SHOW DATABASES checks) still matches.
+    """
+    return '"' + name.upper().replace('"', '""') + '"'
+
+
+# Integer bit widths mapped to DuckDB type names for Arrow schema dispatch
+ARROW_INT_WIDTHS = {8: 'TINYINT', 16: 'SMALLINT', 32: 'INTEGER', 64: 'BIGINT'}
+ARROW_UINT_WIDTHS = {8: 'UTINYINT', 16: 'USMALLINT', 32: 'UINTEGER', 64: 'UBIGINT'}
+
+
+def _arrow_type_to_duckdb(arrow_type) -> str:
+    """Map an Arrow schema type (from a Parquet footer) to a DuckDB type name.
+
+    The result flows through duckdb_type_to_snowflake, so both DDL paths
+    share one Snowflake mapping. Predicates are ordered by how common each
+    type is in analytic tables, so typical columns short-circuit early.
+    """
+    import pyarrow as pa  # Local import: only the fallback DDL path needs it
+
+    t = pa.types
+    if t.is_string(arrow_type) or t.is_large_string(arrow_type):
+        return 'VARCHAR'
+    if t.is_signed_integer(arrow_type):
+        return ARROW_INT_WIDTHS[arrow_type.bit_width]
+    if t.is_floating(arrow_type):
+        return 'DOUBLE' if arrow_type.bit_width == 64 else 'FLOAT'
+    if t.is_timestamp(arrow_type):
+        return 'TIMESTAMP WITH TIME ZONE' if arrow_type.tz else 'TIMESTAMP'
+    if t.is_decimal(arrow_type):
+        return f"DECIMAL({arrow_type.precision},{arrow_type.scale})"
+    if t.is_date(arrow_type):
+        return 'DATE'
+    if t.is_boolean(arrow_type):
+        return 'BOOLEAN'
+    if t.is_unsigned_integer(arrow_type):
+        return ARROW_UINT_WIDTHS[arrow_type.bit_width]
+    if t.is_time(arrow_type):
+        return 'TIME'
+    if t.is_binary(arrow_type) or t.is_large_binary(arrow_type):
+        return 'BLOB'
+    return 'VARCHAR'
+
 
 class DuckDBToSnowflakeConverter:
     """Main converter class that handles the entire conversion pipeline."""
 
-    def __init__(self):
-        self.output_dir = Path(SNOWFLAKE_OUTPUT_DIR).resolve()
-        self.duckdb_extractor = DuckDBExtractor()
-        self.snowflake_conn = None
-
-        # Create output directory structure
-        self.output_dir.mkdir(exist_ok=True)
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self.duckdb_extractor = DuckDBExtractor(verbose=verbose)
+        self._output_dir = None
+        # One cached connection per worker thread: session state (USE
+        # DATABASE/SCHEMA) must not be shared across concurrent conversions,
+        # but each thread can reuse its connection across many files
+        self._thread_conns = threading.local()
+        self._open_conns: List = []
+        self._conn_lock = threading.Lock()
+        # In-memory layer over the on-disk analysis cache, filled by the
+        # parallel pre-analysis pass in convert_all
+        self._analysis_cache: Dict[Path, Dict] = {}
+
+    @property
+    def output_dir(self) -> Path:
+        """Output directory for Parquet files, resolved and created on first use.
+
+        Deferred so dry runs never touch the filesystem.
+        """
+        if self._output_dir is None:
+            self._output_dir = Path(SNOWFLAKE_OUTPUT_DIR).resolve()
+            self._output_dir.mkdir(exist_ok=True)
+        return self._output_dir
+
+    def _execute_queries(self, conn, queries: str, description: str = ""):
+        """Execute a semicolon-separated batch as one multi-statement request.
+
+        execute_string still issues one round trip per statement; passing
+        num_statements lets the server run the whole batch from a single
+        request.
+        """
+        statements = [q.strip() for q in queries.split(';') if q.strip()]
+        if not statements:
+            return
+        conn.cursor().execute('; '.join(statements), num_statements=len(statements))
+
+    def _use_database(self, cursor, db_name: str):
+        """Issue USE DATABASE only when this thread's session is elsewhere."""
+        if getattr(self._thread_conns, 'current_db', None) != db_name:
+            cursor.execute(f"USE DATABASE {_quote_ident(db_name)}")
+            self._thread_conns.current_db = db_name
+            self._thread_conns.current_schema = None
+
+    def _use_schema(self, cursor, schema_name: str):
+        """Issue USE SCHEMA only when this thread's session is elsewhere."""
+        if getattr(self._thread_conns, 'current_schema', None) != schema_name:
+            cursor.execute(f"USE SCHEMA {_quote_ident(schema_name)}")
+            self._thread_conns.current_schema = schema_name
+
+    @staticmethod
+    def _external_stage_config() -> Optional[tuple]:
+        """Return (stage_url, storage_integration) when an external stage is configured."""
+        stage_url = os.getenv('SNOWFLAKE_EXTERNAL_STAGE_URL')
+        storage_integration = os.getenv('SNOWFLAKE_STORAGE_INTEGRATION')
+        if stage_url and storage_integration and stage_url.startswith('s3://'):
+            return stage_url, storage_integration
+        return None
+
+    @staticmethod
+    def _upload_to_s3(parquet_path: Path, stage_url: str, prefix: str):
+        """Upload Parquet file(s) to the external stage's S3 location."""
+        import boto3
+
+        bucket, _, key_prefix = stage_url.replace('s3://', '', 1).partition('/')
+        key_prefix = f"{key_prefix.rstrip('/')}/{prefix}".lstrip('/')
+
+        s3_client = boto3.client('s3')
+        if parquet_path.is_dir():
+            files = sorted(parquet_path.glob('*.parquet'))
+        else:
+            files = [parquet_path]
 
-    def _execute_queries(self, cursor, queries: str, description: str = ""):
-        """Execute multiple SQL queries separated by semicolons."""
-        for query in queries.split(";"):
-            query = query.strip()
-            if query:
-                # print(f"  - {query}")
-                cursor.execute(query)
+        for file_path in files:
+            s3_client.upload_file(str(file_path), bucket, f"{key_prefix}/{file_path.name}")
 
     def add_exclusions(self, exclusion_list: List[str]):
         """Add files to exclusion list."""
         self.duckdb_extractor.add_exclusions(exclusion_list)
 
-    def discover_duckdb_files(self, patterns: List[str] = None) -> List[Path]:
+    def discover_duckdb_files(self, patterns: List[str] = None, include_list: List[str] = None, apply_filters: bool = False) -> List[Path]:
         """Discover DuckDB files in the configured source directory."""
-        return self.duckdb_extractor.discover_duckdb_files(patterns)
+        return self.duckdb_extractor.discover_duckdb_files(patterns, include_list, apply_filters)
 
     def analyze_duckdb_schema(self, db_path: Path) -> Dict:
         """Analyze schema and tables in a DuckDB file."""
         return self.duckdb_extractor.analyze_duckdb_schema(db_path)
 
+    def _cached_analyze(self, db_path: Path) -> Dict:
+        """Schema analysis with an on-disk cache keyed by source mtime/size.
+
+        Re-runs over unchanged DuckDB files (common while debugging a
+        migration) skip the open + catalog introspection entirely. A stale
+        or unreadable cache entry just falls through to a fresh analysis.
+        """
+        cached = self._analysis_cache.get(db_path)
+        if cached is not None:
+            return cached
+
+        stat = db_path.stat()
+        cache_dir = self.output_dir / '.cache'
+        cache_file = cache_dir / f"{db_path.stem}.{stat.st_mtime_ns}.{stat.st_size}.json"
+        if cache_file.exists():
+            try:
+                analysis = json.loads(cache_file.read_text())
+                self._analysis_cache[db_path] = analysis
+                return analysis
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        analysis = self.duckdb_extractor.analyze_duckdb_schema(db_path)
+        self._analysis_cache[db_path] = analysis
+        if 'error' not in analysis:
+            try:
+                cache_dir.mkdir(exist_ok=True)
+                # Drop entries for older versions of this database
+                for stale in cache_dir.glob(f"{db_path.stem}.*.json"):
+                    if stale != cache_file:
+                        stale.unlink()
+                cache_file.write_text(json.dumps(analysis))
+            except OSError:
+                pass
+        return analysis
+
     def should_exclude_file(self, db_path: Path) -> bool:
         """Check if file should be excluded from conversion."""
         return self.duckdb_extractor.should_exclude_file(db_path)
@@ -86,8 +243,15 @@ class DuckDBToSnowflakeConverter:
         return self.duckdb_extractor.should_include_file(db_path, include_list)
 
     def get_snowflake_connection(self):
-        """Get Snowflake connection using environment variables."""
-        if not SNOWFLAKE_AVAILABLE:
+        """Get this thread's cached Snowflake connection, connecting on first use."""
+        conn = getattr(self._thread_conns, 'conn', None)
+        if conn is not None and not conn.is_closed():
+            return conn
+
+        # First use of the connector in this process pays the import cost here
+        try:
+            import snowflake.connector
+        except ImportError:
             raise RuntimeError("Snowflake connector not available. Please install snowflake-connector-python.")
 
         # Get Snowflake credentials from environment
@@ -107,119 +271,319 @@ class DuckDBToSnowflakeConverter:
         conn = snowflake.connector.connect(
             account=account_id,
             user=user,
-            password=password
+            password=password,
+            client_session_keep_alive=True
         )
 
+        self._thread_conns.conn = conn
+        self._thread_conns.current_db = None
+        self._thread_conns.current_schema = None
+        with self._conn_lock:
+            self._open_conns.append(conn)
+
         return conn
 
-    def create_snowflake_database(self, db_name: str) -> bool:
-        """Create or replace a Snowflake database."""
+    def close_connections(self):
+        """Close every cached connection opened by worker threads."""
+        with self._conn_lock:
+            conns, self._open_conns = self._open_conns, []
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def create_snowflake_database(self, conn, db_name: str) -> bool:
+        """Create or replace a Snowflake database on an existing connection."""
         try:
-            with self.get_snowflake_connection() as conn:
-                cursor = conn.cursor()
+            # Drop database if it exists, then create it
+            qdb = _quote_ident(db_name)
+            create_db_query = (
+                f"DROP DATABASE IF EXISTS {qdb}; "
+                f"CREATE DATABASE {qdb}; "
+                f"USE DATABASE {qdb};"
+            )
+            self._execute_queries(conn, create_db_query)
+            self._thread_conns.current_db = db_name
+            self._thread_conns.current_schema = None
 
-                # Drop database if it exists, then create it
-                create_db_query = f"""
-                    DROP DATABASE IF EXISTS {db_name};
-                    CREATE DATABASE {db_name};
-                    USE DATABASE {db_name};
-                """
-                self._execute_queries(cursor, create_db_query)
+            print(f"  ✅ Created/replaced database: {db_name}")
 
-                print(f"  ✅ Created/replaced database: {db_name}")
-
-                return True
+            return True
 
         except Exception as e:
             print(f"  ❌ Error creating database {db_name}: {e}", file=sys.stderr)
             return False
 
 
-    def load_parquet_to_snowflake(self, parquet_path: Path, db_name: str, schema_name: str, table_name: str) -> bool:
-        """Load a Parquet file into Snowflake using internal stage and COPY INTO."""
-        try:
-            with self.get_snowflake_connection() as conn:
-                cursor = conn.cursor()
-
-                # Use the target database and schema
-                cursor.execute(f"USE DATABASE {db_name}")
-                cursor.execute(f"USE SCHEMA {schema_name}")
-
-                # Create a temporary internal stage for this table
-                stage_name = f"temp_stage_{table_name.lower()}"
-                file_format_name = f"temp_parquet_format_{table_name.lower()}"
-
-                # Create file format and stage
-                create_file_format_query = f"CREATE OR REPLACE FILE FORMAT {file_format_name} TYPE = PARQUET USE_LOGICAL_TYPE = TRUE;"
-                cursor.execute(create_file_format_query)
-
-                create_stage_query = f"CREATE OR REPLACE STAGE {stage_name} FILE_FORMAT={file_format_name};"
-                cursor.execute(create_stage_query)
-
-                # Upload the Parquet file to the stage
-                put_query = f"PUT file://{parquet_path} @{stage_name} AUTO_COMPRESS=FALSE OVERWRITE=TRUE;"
-                cursor.execute(put_query)
-
-                # Create table using Snowflake's schema inference from Parquet
-                create_table_query = f"""
-                CREATE OR REPLACE TABLE {table_name}
-                USING TEMPLATE (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
-                    FROM TABLE(
-                        INFER_SCHEMA(
-                            LOCATION=>'@{stage_name}/{parquet_path.name}',
-                            FILE_FORMAT=>'{file_format_name}',
-                            IGNORE_CASE => TRUE
-                        )
-                    )
-                );
-                """
-                cursor.execute(create_table_query)
-
-                # Load data from stage into table using COPY INTO
-                copy_query = f"""
-                COPY INTO {table_name}
-                FROM @{stage_name}/{parquet_path.name}
-                FILE_FORMAT=(FORMAT_NAME='{file_format_name}')
-                MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE
-                ON_ERROR=CONTINUE
-                """
-                cursor.execute(copy_query)
-
-                # Verify data was loaded
-                count_query = f'SELECT COUNT(*) FROM {table_name}'
-                cursor.execute(count_query)
-                count = cursor.fetchone()[0]
-                print(f"    ✅ Loaded {count} rows into {table_name}")
-
-                # Clean up stage and file format
-                cursor.execute(f"DROP STAGE IF EXISTS {stage_name}")
-                cursor.execute(f"DROP FILE FORMAT IF EXISTS {file_format_name}")
-
-                return True
+    def load_parquet_to_snowflake(self, conn, parquet_path: Path, db_name: str, schema_name: str, table_name: str, columns: List[Dict] = None) -> bool:
+        """Load a Parquet file into Snowflake using internal stage and COPY INTO.
 
+        The stage/DDL/COPY pipeline is kept deliberately instead of
+        write_pandas: the data already exists as ZSTD Parquet on disk, so
+        PUT streams it without materializing tables as DataFrames in
+        memory, and the async COPYs overlap across tables.
+        """
+        try:
+            file_format_name, stage_locations = self._stage_database_files(conn, db_name, [parquet_path])
+            stage_location = stage_locations[parquet_path]
+            query_id = self._start_copy(
+                conn, schema_name, table_name, stage_location, file_format_name, columns)
+            fallback_query = self._fallback_copy_query(table_name, stage_location, file_format_name)
+            return self._finish_copy(conn, table_name, query_id, fallback_query)
         except Exception as e:
             print(f"    ❌ Error loading {table_name} to Snowflake: {e}", file=sys.stderr)
             return False
 
-    def _extract_table_name(self, parquet_filename: str) -> str:
-        """Extract table name from Parquet filename."""
-        # For database export: just the filename without extension
-        # For individual table export: {db_name}_main_{table_name}.parquet
-        name_without_ext = parquet_filename.replace('.parquet', '')
+    def _stage_database_files(self, conn, db_name: str, parquet_paths: List[Path]) -> tuple:
+        """Stage all of a database's Parquet files on one shared stage.
+
+        A single TEMPORARY stage serves every table, so the PUT metadata
+        round trips are amortized: plain files go up in one glob PUT, and
+        each per-thread export directory gets one PUT under its own prefix.
+
+        Returns (file_format_name, {parquet_path: stage_location}).
+        """
+        cursor = conn.cursor()
+        self._use_database(cursor, db_name)
+
+        # Temporary stages and file formats are schema-scoped, and the COPY
+        # phase hops between schemas; pin them to PUBLIC and reference them
+        # qualified so every table resolves them regardless of the session's
+        # current schema
+        stage_name = f"PUBLIC.{db_name}_stage"
+        file_format_name = f"PUBLIC.{db_name}_parquet_format"
+        # The vectorized scanner is much faster server-side but only supports
+        # ON_ERROR=ABORT_STATEMENT; a fallback format without it lets files
+        # with schema drift still load with ON_ERROR=CONTINUE
+        cursor.execute(
+            f"CREATE OR REPLACE TEMPORARY FILE FORMAT {file_format_name} "
+            f"TYPE = PARQUET USE_LOGICAL_TYPE = TRUE USE_VECTORIZED_SCANNER = TRUE")
+        cursor.execute(
+            f"CREATE OR REPLACE TEMPORARY FILE FORMAT {file_format_name}_fallback "
+            f"TYPE = PARQUET USE_LOGICAL_TYPE = TRUE")
+
+        stage_locations = {}
+        external_stage = self._external_stage_config()
+        if external_stage:
+            # Upload directly to the external stage bucket, skipping
+            # the PUT round trip through Snowflake's internal stage
+            stage_url, storage_integration = external_stage
+            s3_prefix = db_name.lower()
+            for parquet_path in parquet_paths:
+                if parquet_path.is_dir():
+                    subdir = parquet_path.name.replace('.parquet', '').lower()
+                    self._upload_to_s3(parquet_path, stage_url, f"{s3_prefix}/{subdir}")
+                    stage_locations[parquet_path] = f"@{stage_name}/{subdir}"
+                else:
+                    self._upload_to_s3(parquet_path, stage_url, s3_prefix)
+                    stage_locations[parquet_path] = f"@{stage_name}/{parquet_path.name}"
+
+            create_stage_query = (
+                f"CREATE OR REPLACE TEMPORARY STAGE {stage_name} "
+                f"URL='{stage_url.rstrip('/')}/{s3_prefix}' "
+                f"STORAGE_INTEGRATION={storage_integration} "
+                f"FILE_FORMAT={file_format_name}"
+            )
+            cursor.execute(create_stage_query)
+        else:
+            cursor.execute(f"CREATE OR REPLACE TEMPORARY STAGE {stage_name} FILE_FORMAT={file_format_name}")
+
+            # Large tables are exported as a directory of per-thread files;
+            # each directory gets its own prefix so COPY INTO can target it
+            single_files = []
+            for parquet_path in parquet_paths:
+                if parquet_path.is_dir():
+                    subdir = parquet_path.name.replace('.parquet', '').lower()
+                    cursor.execute(
+                        f"PUT file://{parquet_path}/*.parquet @{stage_name}/{subdir} {PUT_OPTIONS}")
+                    stage_locations[parquet_path] = f"@{stage_name}/{subdir}"
+                else:
+                    single_files.append(parquet_path)
+                    stage_locations[parquet_path] = f"@{stage_name}/{parquet_path.name}"
+
+            if single_files:
+                parent_dirs = {p.parent for p in single_files}
+                if len(parent_dirs) == 1 and len(single_files) > 1 and not any(
+                        p.is_dir() for p in parent_dirs.pop().glob('*.parquet')):
+                    # All plain files share a directory with no directory
+                    # exports mixed in: one glob PUT uploads them together
+                    cursor.execute(
+                        f"PUT file://{single_files[0].parent}/*.parquet @{stage_name} {PUT_OPTIONS}")
+                else:
+                    for parquet_path in single_files:
+                        cursor.execute(
+                            f"PUT file://{parquet_path} @{stage_name} {PUT_OPTIONS}")
+
+        return file_format_name, stage_locations
+
+    @staticmethod
+    def _read_export_manifest(db_parquet_dir: Path, src_key: List[int]) -> Optional[Dict]:
+        """Return the previous export's results if the source is unchanged.
+
+        The manifest records the source DuckDB file's mtime/size and the
+        exported Parquet files; a match means the Parquet phase can be
+        skipped entirely on re-runs.
+        """
+        manifest_path = db_parquet_dir / '.manifest.json'
+        if not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+        if manifest.get('src_key') != src_key:
+            return None
+        parquet_files = manifest.get('parquet_files', [])
+        if not parquet_files or not all(Path(f['file_path']).exists() for f in parquet_files):
+            return None
+        return {
+            'success': True,
+            'tables_exported': manifest.get('tables_exported', len(parquet_files)),
+            'parquet_files': parquet_files,
+            'errors': []
+        }
 
-        # Check if it's the old format with underscores and 'main'
-        parts = name_without_ext.split('_')
+    @staticmethod
+    def _write_export_manifest(db_parquet_dir: Path, src_key: List[int], parquet_results: Dict):
+        """Persist the export results so an unchanged source can skip re-export."""
         try:
-            main_index = parts.index('main')
-            if main_index + 1 < len(parts):
-                # Return everything after 'main'
-                return '_'.join(parts[main_index + 1:])
-        except ValueError:
+            (db_parquet_dir / '.manifest.json').write_text(json.dumps({
+                'src_key': src_key,
+                'tables_exported': parquet_results['tables_exported'],
+                'parquet_files': parquet_results['parquet_files']
+            }))
+        except OSError:
             pass
 
-        # For database export format, just use the filename without extension
-        return name_without_ext
+    @staticmethod
+    def _columns_from_parquet(parquet_path: Path) -> Optional[List[Dict]]:
+        """Read column names and types from a local Parquet footer.
+
+        pq.read_schema parses only the schema section of the footer — far
+        less work than constructing a ParquetFile with all row-group stats.
+        Used when the catalog analysis did not supply columns, so the DDL
+        can still be built locally instead of through a server-side
+        INFER_SCHEMA round trip. Returns None if the schema cannot be read.
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            return None
+
+        if parquet_path.is_dir():
+            parts = sorted(parquet_path.glob('*.parquet'))
+            if not parts:
+                return None
+            parquet_path = parts[0]
+
+        try:
+            schema = pq.read_schema(parquet_path)
+        except Exception:
+            return None
+
+        return [
+            {'name': field.name, 'type': _arrow_type_to_duckdb(field.type)}
+            for field in schema
+        ]
+
+    @staticmethod
+    def _create_table_ddl(table_name: str, columns: List[Dict]) -> str:
+        """CREATE TABLE statement built from the DuckDB schema analysis.
+
+        This avoids a second parse/metadata round trip through INFER_SCHEMA
+        and keeps the source column types instead of inferred ones.
+        """
+        column_defs = ", ".join(
+            f"{_quote_ident(col['name'])} {duckdb_type_to_snowflake(col['type'])}"
+            for col in columns
+        )
+        return f"CREATE OR REPLACE TABLE {_quote_ident(table_name)} ({column_defs})"
+
+    def _start_copy(self, conn, schema_name: str, table_name: str, stage_location: str,
+                    file_format_name: str, columns: List[Dict] = None,
+                    create_table: bool = True) -> str:
+        """Create a table from staged Parquet and kick off an async COPY INTO.
+
+        Pass create_table=False when the table's DDL was already batched
+        ahead of staging. Returns the Snowflake query id of the running
+        COPY statement.
+        """
+        cursor = conn.cursor()
+        self._use_schema(cursor, schema_name)
+
+        if create_table:
+            if columns:
+                create_table_query = self._create_table_ddl(table_name, columns)
+            else:
+                # Fall back to Snowflake's schema inference from Parquet
+                create_table_query = (
+                    f"CREATE OR REPLACE TABLE {_quote_ident(table_name)} USING TEMPLATE ("
+                    f"SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*)) FROM TABLE("
+                    f"INFER_SCHEMA(LOCATION=>'{stage_location}', "
+                    f"FILE_FORMAT=>'{file_format_name}', IGNORE_CASE => TRUE)))"
+                )
+            cursor.execute(create_table_query)
+
+        # Kick off the COPY asynchronously so all tables load concurrently;
+        # stage and file format are TEMPORARY, so they are dropped
+        # automatically when the session ends
+        copy_query = (
+            f"COPY INTO {_quote_ident(table_name)} FROM {stage_location} "
+            f"FILE_FORMAT=(FORMAT_NAME='{file_format_name}') "
+            f"MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE ON_ERROR=ABORT_STATEMENT"
+        )
+        cursor.execute_async(copy_query)
+        return cursor.sfqid
+
+    @staticmethod
+    def _fallback_copy_query(table_name: str, stage_location: str, file_format_name: str) -> str:
+        """COPY INTO retry without the vectorized scanner, tolerating bad rows."""
+        return (
+            f"COPY INTO {_quote_ident(table_name)} FROM {stage_location} "
+            f"FILE_FORMAT=(FORMAT_NAME='{file_format_name}_fallback') "
+            f"MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE ON_ERROR=CONTINUE"
+        )
+
+    def _finish_copy(self, conn, table_name: str, query_id: str, fallback_query: str = None) -> bool:
+        """Wait for an async COPY INTO to complete and report its row count."""
+        try:
+            cursor = conn.cursor()
+            cursor.get_results_from_sfqid(query_id)
+            rows = cursor.fetchall()
+        except Exception as e:
+            if not fallback_query:
+                print(f"    ❌ Error loading {table_name} to Snowflake: {e}", file=sys.stderr)
+                return False
+            # ABORT_STATEMENT rejects the whole file on any bad row; retry
+            # without the vectorized scanner so the good rows still load
+            try:
+                cursor = conn.cursor()
+                cursor.execute(fallback_query)
+                rows = cursor.fetchall()
+            except Exception as retry_error:
+                print(f"    ❌ Error loading {table_name} to Snowflake: {retry_error}", file=sys.stderr)
+                return False
+
+        # COPY INTO returns one row per file with rows_parsed/rows_loaded,
+        # so no verification COUNT(*) round trip is needed
+        count = sum(row[COPY_ROWS_LOADED_IDX] for row in rows if len(row) > COPY_ROWS_LOADED_IDX)
+        if self.verbose:
+            print(f"    ✅ Loaded {count} rows into {table_name}")
+        return True
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _extract_table_name(parquet_filename: str, db_name: str, schema_name: str) -> str:
+        """Extract table name from Parquet filename.
+
+        Individual table exports are named {db_name}_{schema_name}_{table}
+        .parquet; database exports use just {table}.parquet, where the
+        prefix strip is a no-op. Stripping the exact known prefix avoids
+        mis-parsing table names that themselves contain the schema name.
+        """
+        name = parquet_filename.removesuffix('.parquet')
+        return name.removeprefix(f"{db_name}_{schema_name}_")
 
 
     def convert_duckdb_to_snowflake(self, duckdb_path: Path, db_name: str = None, use_database_export: bool = False) -> Optional[Dict]:
@@ -229,8 +593,8 @@ class DuckDBToSnowflakeConverter:
 
         print(f"Converting {duckdb_path.name} to Snowflake database '{db_name}'...")
 
-        # Analyze the DuckDB file first
-        analysis = self.analyze_duckdb_schema(duckdb_path)
+        # Analyze the DuckDB file first (cached across runs on disk)
+        analysis = self._cached_analyze(duckdb_path)
         if 'error' in analysis:
             print(f"Error analyzing {duckdb_path.name}: {analysis['error']}", file=sys.stderr)
             return None
@@ -248,8 +612,12 @@ class DuckDBToSnowflakeConverter:
         }
 
         try:
+            # This thread's cached connection covers database creation and
+            # every table load; it stays open for reuse by the next file and
+            # is closed once by convert_all
+            conn = self.get_snowflake_connection()
             # Create Snowflake database
-            if not self.create_snowflake_database(db_name):
+            if not self.create_snowflake_database(conn, db_name):
                 results['errors'].append("Failed to create database")
                 return results
 
@@ -257,8 +625,15 @@ class DuckDBToSnowflakeConverter:
             db_parquet_dir = self.output_dir / db_name
             db_parquet_dir.mkdir(exist_ok=True)
 
-            # Export all tables to Parquet using shared utility
-            if use_database_export:
+            # Skip the Parquet export when the source DuckDB file is
+            # unchanged since the last successful export
+            src_stat = duckdb_path.stat()
+            src_key = [src_stat.st_mtime_ns, src_stat.st_size]
+            parquet_results = self._read_export_manifest(db_parquet_dir, src_key)
+            if parquet_results is not None:
+                if self.verbose:
+                    print(f"  Source unchanged, reusing {len(parquet_results['parquet_files'])} exported Parquet files")
+            elif use_database_export:
                 # Use the more efficient database export
                 parquet_results = self.duckdb_extractor.export_database_to_parquet(
                     duckdb_path,
@@ -277,20 +652,82 @@ class DuckDBToSnowflakeConverter:
                 results['errors'].append(parquet_results['error'])
                 return results
 
-            results['tables_exported'] = parquet_results['tables_exported']
+            # Only record the export as reusable when every table made it
+            # out; a partial export must be redone on the next run, not
+            # skipped via the manifest
+            if not parquet_results.get('errors'):
+                self._write_export_manifest(db_parquet_dir, src_key, parquet_results)
 
-            # Load each Parquet file to Snowflake
-            for parquet_info in parquet_results['parquet_files']:
-                schema_name = parquet_info['schema']
-                parquet_path = Path(parquet_info['file_path'])
+            results['tables_exported'] = parquet_results['tables_exported']
 
+            # Map table names to their analyzed columns so the loader can build
+            # CREATE TABLE statements without INFER_SCHEMA round trips
+            table_columns = {
+                table_info['name']: table_info.get('columns')
+                for schema_info in analysis['schemas'].values()
+                for table_info in schema_info['tables']
+            }
+
+            # Stage the whole database's Parquet files on one shared
+            # stage, then start every COPY asynchronously; results are
+            # collected once all copies are dispatched.
+            schema_by_path = {
+                Path(parquet_info['file_path']): parquet_info['schema']
+                for parquet_info in parquet_results['parquet_files']
+            }
+
+            # Batch every known table's DDL into one round trip before
+            # staging; only tables without analyzed columns fall back to
+            # per-table INFER_SCHEMA after the files are staged
+            precreated = set()
+            ddl_statements = []
+            batch_schema = None
+            for parquet_path, schema_name in schema_by_path.items():
+                table_name = self._extract_table_name(parquet_path.name, db_name, schema_name)
+                columns = table_columns.get(table_name)
+                if not columns:
+                    # Not in the catalog analysis (e.g. name mismatch from a
+                    # database export); read the schema from the local
+                    # Parquet footer before resorting to INFER_SCHEMA
+                    columns = self._columns_from_parquet(parquet_path)
+                    table_columns[table_name] = columns
+                if columns:
+                    target_schema = "PUBLIC" if schema_name == "main" else schema_name
+                    if target_schema != batch_schema:
+                        ddl_statements.append(f"USE SCHEMA {_quote_ident(target_schema)}")
+                        batch_schema = target_schema
+                    ddl_statements.append(self._create_table_ddl(table_name, columns))
+                    precreated.add(table_name)
+            if ddl_statements:
+                self._execute_queries(conn, ";\n".join(ddl_statements))
+                self._thread_conns.current_schema = batch_schema
+
+            file_format_name, stage_locations = self._stage_database_files(
+                conn, db_name, list(schema_by_path))
+
+            pending_copies = []
+            for parquet_path, schema_name in schema_by_path.items():
                 # Extract table name from Parquet filename
-                table_name = self._extract_table_name(parquet_path.name)
+                table_name = self._extract_table_name(parquet_path.name, db_name, schema_name)
 
-                print(f"    Loading {table_name} to Snowflake...")
+                if self.verbose:
+                    print(f"    Loading {table_name} to Snowflake...")
 
                 target_schema = "PUBLIC" if schema_name == "main" else schema_name
-                if self.load_parquet_to_snowflake(parquet_path, db_name, target_schema, table_name):
+                try:
+                    stage_location = stage_locations[parquet_path]
+                    query_id = self._start_copy(
+                        conn, target_schema, table_name, stage_location,
+                        file_format_name, columns=table_columns.get(table_name),
+                        create_table=table_name not in precreated)
+                    fallback_query = self._fallback_copy_query(
+                        table_name, stage_location, file_format_name)
+                    pending_copies.append((table_name, query_id, fallback_query))
+                except Exception as e:
+                    print(f"    ❌ Error staging {table_name}: {e}", file=sys.stderr)
+
+            for table_name, query_id, fallback_query in pending_copies:
+                if self._finish_copy(conn, table_name, query_id, fallback_query):
                     results['tables_loaded'] += 1
 
             return results
@@ -300,94 +737,113 @@ class DuckDBToSnowflakeConverter:
             results['errors'].append(str(e))
             return results
 
-    def convert_all(self, exclusion_list: List[str] = None, include_list: List[str] = None, use_database_export: bool = False) -> Dict:
+    def convert_all(self, exclusion_list: List[str] = None, include_list: List[str] = None, use_database_export: bool = False, dry_run: bool = False, max_workers: int = 4) -> Dict:
         """Convert all discovered DuckDB files to Snowflake databases."""
         if exclusion_list:
             self.add_exclusions(exclusion_list)
 
-        # Discover DuckDB files
+        # Discover DuckDB files with include/exclude filtering applied during
+        # the directory scan itself, so rejected files are never collected
         print(f"Discovering DuckDB files in {self.duckdb_extractor.source_dir}...")
-        duckdb_files = self.discover_duckdb_files()
-        print(f"Found {len(duckdb_files)} DuckDB files")
-
-        # Filter files based on include/exclude logic
-        filtered_files = self.duckdb_extractor.filter_files(duckdb_files, include_list)
-        excluded_count = len(duckdb_files) - len(filtered_files)
+        filtered_files = self.discover_duckdb_files(include_list=include_list, apply_filters=True)
+        excluded_count = self.duckdb_extractor.last_excluded_count
+        total_discovered = len(filtered_files) + excluded_count
+        print(f"Found {total_discovered} DuckDB files")
         if excluded_count > 0:
             print(f"Excluded {excluded_count} files based on exclusion list")
 
+        if dry_run:
+            # Report what would be converted without touching Snowflake or
+            # writing anything to disk
+            print(f"Dry run: would process {len(filtered_files)} files:")
+            for duckdb_path in filtered_files:
+                print(f"  - {duckdb_path.name} -> database '{duckdb_path.stem}'")
+            return {
+                'converted': [],
+                'failed': [],
+                'skipped': [str(f) for f in filtered_files],
+                'total_discovered': total_discovered,
+                'total_processed': 0
+            }
+
         print(f"Processing {len(filtered_files)} files...")
 
         results = {
             'converted': [],
             'failed': [],
             'skipped': [],
-            'total_discovered': len(duckdb_files),
+            'total_discovered': total_discovered,
             'total_processed': len(filtered_files)
         }
 
-        # Process each file
-        for i, duckdb_path in enumerate(filtered_files, 1):
-            print(f"\n[{i}/{len(filtered_files)}] Processing {duckdb_path.name}...")
-
-            # Convert to Snowflake
-            conversion_result = self.convert_duckdb_to_snowflake(duckdb_path, use_database_export=use_database_export)
+        # Pre-analyze every file in parallel so schema introspection
+        # (local disk-bound) is done before the network-bound load phase
+        # starts, rather than lazily one file at a time
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as analyzer:
+            for _ in analyzer.map(self._cached_analyze, filtered_files):
+                pass
 
-            if conversion_result is None or conversion_result.get('errors'):
-                results['failed'].append({
-                    'duckdb_file': str(duckdb_path),
-                    'errors': conversion_result.get('errors', ['Unknown error']) if conversion_result else ['Conversion failed']
-                })
-                continue
-
-            results['converted'].append(conversion_result)
+        # Convert files concurrently; each file's PUT/COPY round trips are
+        # I/O-bound against Snowflake, so a thread pool overlaps the network
+        # latency of one database with another's
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.convert_duckdb_to_snowflake, duckdb_path, use_database_export=use_database_export): duckdb_path
+                    for duckdb_path in filtered_files
+                }
+
+                for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                    duckdb_path = futures[future]
+                    try:
+                        conversion_result = future.result()
+                    except Exception as e:
+                        conversion_result = None
+                        print(f"Error converting {duckdb_path.name}: {e}", file=sys.stderr)
+
+                    print(f"[{i}/{len(filtered_files)}] Finished {duckdb_path.name}")
+
+                    if conversion_result is None or conversion_result.get('errors'):
+                        results['failed'].append({
+                            'duckdb_file': str(duckdb_path),
+                            'errors': conversion_result.get('errors', ['Unknown error']) if conversion_result else ['Conversion failed']
+                        })
+                        continue
+
+                    results['converted'].append(conversion_result)
+        finally:
+            # Worker threads cache their connections for reuse across files;
+            # close them all once the run is over
+            self.close_connections()
 
         return results
 
 
-def main(include: List[str] = None, exclude: List[str] = None, use_database_export: bool = False):
-    # If called from command line with no parameters, use argparse
-    if include is None and exclude is None and use_database_export is False and len(sys.argv) > 1:
-        parser = argparse.ArgumentParser(add_help=False)
-
-        parser.add_argument(
-            "--exclude",
-            nargs="*",
-            default=[]
-        )
-
-        parser.add_argument(
-            "--include",
-            nargs="*",
-            default=[]
-        )
+def main(include: List[str] = None, exclude: List[str] = None, use_database_export: bool = False, dry_run: bool = False, verbose: bool = False, workers: int = 4):
+    """Run the migration with the given arguments.
 
-        parser.add_argument(
-            "--use-database-export",
-            action="store_true",
-            help="Use DuckDB's EXPORT DATABASE command for more efficient export (default: use individual table export)"
-        )
-
-        args = parser.parse_args()
-        include = args.include
-        exclude = args.exclude
-        use_database_export = args.use_database_export
+    Callers (the `ade migrate` wrapper or `_cli` below) pass arguments
+    explicitly; this function never inspects sys.argv.
+    """
+    # Load environment variables from .env file; deferred to runtime so that
+    # importing this module stays cheap
+    load_dotenv()
 
     # Convert None to empty list
     include = include or []
     exclude = exclude or []
 
-    # Check if Snowflake is available
-    if not SNOWFLAKE_AVAILABLE:
+    # Check if Snowflake is available (not needed for a dry run)
+    if not _snowflake_available() and not dry_run:
         print("Error: Snowflake connector not available. Please install snowflake-connector-python.", file=sys.stderr)
         sys.exit(1)
 
     # Create converter
-    converter = DuckDBToSnowflakeConverter()
+    converter = DuckDBToSnowflakeConverter(verbose=verbose)
 
     # Perform conversion
     try:
-        results = converter.convert_all(exclude, include, use_database_export)
+        results = converter.convert_all(exclude, include, use_database_export, dry_run=dry_run, max_workers=workers)
 
         # Print summary
         print(f"\n{'='*60}")
@@ -416,5 +872,57 @@ def main(include: List[str] = None, exclude: List[str] = None, use_database_expo
         sys.exit(1)
 
 
+def _cli():
+    """Parse command-line arguments when the script is run directly."""
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument(
+        "--exclude",
+        nargs="*",
+        default=[]
+    )
+
+    parser.add_argument(
+        "--include",
+        nargs="*",
+        default=[]
+    )
+
+    parser.add_argument(
+        "--use-database-export",
+        action="store_true",
+        help="Use DuckDB's EXPORT DATABASE command for more efficient export (default: use individual table export)"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the files that would be converted without exporting or loading anything"
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print per-table progress; by default only per-database progress and the final summary are shown"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of DuckDB files to convert concurrently (default: 4)"
+    )
+
+    args = parser.parse_args()
+    main(
+        include=args.include,
+        exclude=args.exclude,
+        use_database_export=args.use_database_export,
+        dry_run=args.dry_run,
+        verbose=args.verbose,
+        workers=args.workers,
+    )
+
+
 if __name__ == "__main__":
-    main()
+    _cli()
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Script to render file diff logs as beautiful HTML with color coding."""
 
+import functools
+import hashlib
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -10,184 +13,59 @@ from datetime import datetime
 # Add the project root to the sys path
 sys.path.append(str(Path(__file__).parent.parent))
 
-
-def find_diff_logs(experiment_dir):
-    """Find all file_diff_log.txt files in the experiment directory."""
-    return list(Path(experiment_dir).rglob("file_diff_log.txt"))
-
-
-def load_diff_json(diff_log_path: Path) -> dict:
-    """Load the JSON diff data from the corresponding file_diffs.json file."""
-    json_path = diff_log_path.parent / "file_diffs.json"
-    if not json_path.exists():
-        return {}
-
-    try:
-        with open(json_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Warning: Could not load JSON diff data: {e}")
-        return {}
-
-
-def get_file_content(json_data: dict, file_path: str, snapshot_type: str = 'after') -> str:
-    """Get file content from optimized JSON data structure."""
-    if not json_data or 'content_manager' not in json_data:
-        return ""
-
-    content_manager = json_data['content_manager']
-    content_store = content_manager.get('content_store', {})
-
-    # Look through diffs to find the file in the specified snapshot type
-    for diff_data in json_data.get('diffs', []):
-        snapshot_data = diff_data.get(snapshot_type, {})
-        file_hashes = snapshot_data.get('file_hashes', {})
-
-        # Get the content hash for this file from the snapshot
-        content_hash = file_hashes.get(file_path)
-        if content_hash:
-            return content_store.get(content_hash, "")
-
-    return ""
-
-
-def parse_diff_log(log_content: str) -> list[dict]:
-    """Parse the file diff log content into structured data."""
-    phases = []
-    current_phase = None
-
-    lines = log_content.split('\n')
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Look for phase headers
-        if line.startswith('=' * 60):
-            i += 1
-            if i < len(lines) and 'FILE DIFF' in lines[i]:
-                phase_line = lines[i].strip()
-                phase_match = re.search(r'FILE DIFF - (\w+) PHASE', phase_line)
-                if phase_match:
-                    phase_name = phase_match.group(1).lower()
-                    i += 1
-
-                    # Get timestamp
-                    timestamp = None
-                    if i < len(lines) and lines[i].strip().startswith('Timestamp:'):
-                        timestamp_str = lines[i].strip().replace('Timestamp:', '').strip()
-                        try:
-                            timestamp = datetime.fromisoformat(timestamp_str)
-                        except ValueError:
-                            pass
-                        i += 1
-
-                    # Initialize phase data
-                    current_phase = {
-                        'name': phase_name,
-                        'timestamp': timestamp,
-                        'added_files': [],
-                        'removed_files': [],
-                        'modified_files': [],
-                        'unified_diffs': {}
-                    }
-                    phases.append(current_phase)
-                    continue
-
-        # Look for file lists (but don't collect files here - they're listed individually)
-        if current_phase and ('ADDED FILES' in line or 'REMOVED FILES' in line or 'MODIFIED FILES' in line):
-            # Just skip the header line - files are listed individually with ~ prefix
-            pass
-
-        # Look for individual file entries (with +, -, or ~ prefix)
-        if current_phase and lines[i].startswith('  + '):
-            # This is an added file entry
-            file_path = lines[i][4:].strip()  # Remove the '  + ' prefix
-            if file_path not in current_phase['added_files']:
-                current_phase['added_files'].append(file_path)
-        elif current_phase and lines[i].startswith('  - '):
-            # This is a removed file entry
-            file_path = lines[i][4:].strip()  # Remove the '  - ' prefix
-            if file_path not in current_phase['removed_files']:
-                current_phase['removed_files'].append(file_path)
-        elif current_phase and lines[i].startswith('  ~ '):
-            # This is a modified file entry
-            file_path = lines[i][4:].strip()  # Remove the '  ~ ' prefix
-            if file_path not in current_phase['modified_files']:
-                current_phase['modified_files'].append(file_path)
-
-        # Look for unified diff sections
-        if current_phase and 'UNIFIED DIFF for' in line:
-            # Extract file path from the line
-            file_path = line.replace('UNIFIED DIFF for', '').strip()
-            # Remove trailing colon if present
-            if file_path.endswith(':'):
-                file_path = file_path[:-1]
-            i += 1
-
-            # Collect diff content until we hit the next file or phase
-            diff_lines = []
-            while i < len(lines):
-                current_line = lines[i]
-                # Stop if we hit another unified diff, phase separator, or file entry
-                # Don't stop at empty lines as they can be part of the diff
-                if ('UNIFIED DIFF for' in current_line or
-                    current_line.strip().startswith('=' * 60) or
-                    current_line.strip().startswith('ADDED FILES') or
-                    current_line.strip().startswith('REMOVED FILES') or
-                    current_line.strip().startswith('MODIFIED FILES') or
-                    current_line.startswith('  ~ ')):
-                    break
-                diff_lines.append(current_line)
-                i += 1
-
-            if diff_lines:
-                current_phase['unified_diffs'][file_path] = '\n'.join(diff_lines)
-
-        i += 1
-
-    return phases
-
-
-def generate_html(phases: list[dict], task_id: str = None, json_data: dict = None) -> str:
-    """Generate HTML content from parsed diff phases."""
-    html = f"""<!DOCTYPE html>
+# Translate table applied to whole content chunks; one C-level pass is much
+# cheaper than per-line html.escape calls.
+_HTML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+_SEP = '=' * 60
+_PHASE_RE = re.compile(r'FILE DIFF - (\w+) PHASE')
+_UNIFIED_DIFF_MARKER = 'UNIFIED DIFF for'
+_FILE_LIST_HEADERS = ('ADDED FILES', 'REMOVED FILES', 'MODIFIED FILES')
+# Unified-diff headers that point at temporary snapshot files, not real
+# project paths; one tuple startswith replaces three per-line checks.
+_TMP_PREFIXES = ('--- /tmp', '+++ /tmp', '--- /var/folders', '+++ /var/folders')
+
+# Static document head/style/script, split around the two title insertion
+# points so no per-call template formatting is needed.
+_HTML_HEAD_1 = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>File Diff Log{f" - {task_id}" if task_id else ""}</title>
+    <title>File Diff Log"""
+
+_HTML_HEAD_2 = """</title>
     <style>
-        body {{
+        body {
             font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
             background-color: #1e1e1e;
             color: #d4d4d4;
             margin: 0;
             padding: 10px;
             line-height: 1.2;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
 
-        h1 {{
+        h1 {
             color: #569cd6;
             font-size: 18px;
             margin-bottom: 15px;
             border-bottom: 1px solid #3c3c3c;
             padding-bottom: 8px;
-        }}
+        }
 
-        .phase {{
+        .phase {
             margin-bottom: 20px;
             border: 1px solid #3c3c3c;
             border-radius: 4px;
             overflow: hidden;
-        }}
+        }
 
-        .phase-header {{
+        .phase-header {
             background-color: #2d2d30;
             padding: 8px 12px;
             cursor: pointer;
@@ -196,300 +74,561 @@ def generate_html(phases: list[dict], task_id: str = None, json_data: dict = Non
             align-items: center;
             justify-content: space-between;
             transition: background-color 0.2s;
-        }}
+        }
 
-        .phase-header:hover {{
+        .phase-header:hover {
             background-color: #3c3c3c;
-        }}
+        }
 
-        .phase-header.collapsed .collapse-icon {{
+        .phase-header.collapsed .collapse-icon {
             transform: rotate(-90deg);
-        }}
+        }
 
-        .phase-stats {{
+        .phase-stats {
             margin-top: 4px;
             font-size: 11px;
             color: #9cdcfe;
-        }}
+        }
 
-        .phase-title {{
+        .phase-title {
             color: #4ec9b0;
             font-size: 14px;
             font-weight: bold;
-        }}
+        }
 
-        .collapse-icon {{
+        .collapse-icon {
             color: #9cdcfe;
             font-size: 12px;
             transition: transform 0.2s;
-        }}
+        }
 
-        .phase-content {{
+        .phase-content {
             background-color: #1e1e1e;
             transition: max-height 0.3s ease, padding 0.3s ease, opacity 0.3s ease;
             overflow: hidden;
-        }}
+        }
 
-        .phase-content.collapsed {{
+        .phase-content.collapsed {
             max-height: 0;
             padding: 0;
             opacity: 0;
-        }}
+        }
 
-        .file-list {{
+        .file-list {
             margin-bottom: 15px;
-        }}
+        }
 
-        .file-list-title {{
+        .file-list-title {
             color: #569cd6;
             font-size: 12px;
             margin-bottom: 6px;
             font-weight: bold;
-        }}
+        }
 
-        .file-item {{
+        .file-item {
             background-color: #2d2d30;
             padding: 4px 8px;
             margin: 2px 0;
             border-radius: 2px;
             font-size: 11px;
             font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-        }}
+        }
 
-        .file-item.added {{
+        .file-item.added {
             background-color: rgba(13, 79, 13, 0.3);
             color: #4ec9b0;
-        }}
+        }
 
-        .file-item.removed {{
+        .file-item.removed {
             background-color: rgba(79, 13, 13, 0.3);
             color: #f44747;
-        }}
+        }
 
-        .file-item.modified {{
+        .file-item.modified {
             background-color: rgba(79, 79, 13, 0.3);
             color: #dcdcaa;
-        }}
+        }
 
-        .diff-container {{
+        .diff-container {
             margin-top: 15px;
-        }}
+        }
 
-        .diff-header {{
+        .diff-header {
             background-color: #2d2d30;
             padding: 6px 10px;
             font-size: 11px;
             font-weight: bold;
             color: #569cd6;
             border-bottom: 1px solid #3c3c3c;
-        }}
+        }
 
-        .diff-content {{
+        .diff-content {
             background-color: #1e1e1e;
             padding: 8px;
             font-size: 10px;
             line-height: 1.1;
             overflow-x: auto;
-        }}
+        }
 
-        .diff-line {{
+        .diff-line {
             margin: 0;
             padding: 1px 0;
             font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-        }}
+        }
 
-        .diff-line.added {{
+        .diff-line.added {
             background-color: rgba(13, 79, 13, 0.3);
             color: #4ec9b0;
-        }}
+        }
 
-        .diff-line.removed {{
+        .diff-line.removed {
             background-color: rgba(79, 13, 13, 0.3);
             color: #f44747;
-        }}
+        }
 
-        .diff-line.context {{
+        .diff-line.context {
             color: #9cdcfe;
-        }}
+        }
 
-        .phase-separator {{
+        .phase-separator {
             height: 1px;
             background: linear-gradient(90deg, transparent, #3c3c3c, transparent);
             margin: 15px 0;
-        }}
+        }
 
-        .no-changes {{
+        .no-changes {
             color: #6a9955;
             font-style: italic;
             text-align: center;
             padding: 20px;
-        }}
+        }
 
     </style>
     <script>
-        function togglePhase(phaseId) {{
+        function togglePhase(phaseId) {
             const header = document.getElementById(phaseId + '-header');
             const content = document.getElementById(phaseId + '-content');
 
             header.classList.toggle('collapsed');
             content.classList.toggle('collapsed');
-        }}
+        }
     </script>
 </head>
 <body>
     <div class="container">
-        <h1>File Diff Log{f" - {task_id}" if task_id else ""}</h1>
+        <h1>File Diff Log"""
+
+_HTML_HEAD_3 = """</h1>
 """
 
-    # Generate phases
-    for i, phase in enumerate(phases):
-        phase_id = f"phase-{i}"
 
-        # Calculate stats for this phase
-        added_count = len(phase['added_files'])
-        removed_count = len(phase['removed_files'])
-        modified_count = len(phase['modified_files'])
+def escape_html(text: str) -> str:
+    """Escape &, < and > for safe HTML interpolation."""
+    return text.translate(_HTML_ESCAPES)
+
+
+def find_diff_logs(experiment_dir):
+    """Find all file_diff_log.txt files in the experiment directory.
+
+    Walks with os.scandir rather than Path.rglob; DirEntry answers is_dir
+    without an extra stat on most platforms.
+    """
+    stack = [os.fspath(experiment_dir)]
+    diff_logs = []
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "file_diff_log.txt":
+                        diff_logs.append(Path(entry.path))
+        except OSError:
+            continue
+    return diff_logs
+
 
-        # Build stats HTML
-        stats_parts = []
-        if added_count > 0:
-            stats_parts.append(f"Files added: {added_count}")
-        if removed_count > 0:
-            stats_parts.append(f"Files removed: {removed_count}")
-        if modified_count > 0:
-            stats_parts.append(f"Files modified: {modified_count}")
+def load_diff_json(diff_log_path: Path) -> dict:
+    """Load the JSON diff data from the corresponding file_diffs.json file."""
+    json_path = diff_log_path.parent / "file_diffs.json"
+    if not json_path.exists():
+        return {}
 
-        stats_html = " | ".join(stats_parts) if stats_parts else "No changes"
+    try:
+        with open(json_path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Warning: Could not load JSON diff data: {e}")
+        return {}
 
-        html += f"""
+
+def build_content_index(json_data: dict) -> dict:
+    """Map (snapshot_type, file_path) -> file content for O(1) lookups.
+
+    Keeps the first diff's content for each path, matching the old
+    scan-in-order behavior.
+    """
+    index = {}
+    if not json_data or 'content_manager' not in json_data:
+        return index
+
+    content_store = json_data['content_manager'].get('content_store', {})
+
+    for diff_data in json_data.get('diffs', []):
+        for snapshot_type in ('before', 'after'):
+            file_hashes = diff_data.get(snapshot_type, {}).get('file_hashes', {})
+            for file_path, content_hash in file_hashes.items():
+                key = (snapshot_type, file_path)
+                if key not in index:
+                    index[key] = content_store.get(content_hash, "")
+    return index
+
+
+def _parse_timestamp(timestamp_str: str):
+    """Parse a log timestamp (YYYY-MM-DDTHH:MM:SS[.ffffff]) or return None.
+
+    Slices the fixed-width fields directly into datetime(); falls back to
+    fromisoformat if the format ever drifts.
+    """
+    try:
+        return datetime(
+            int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+            int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+            int(timestamp_str[20:26]) if len(timestamp_str) > 19 else 0,
+        )
+    except (ValueError, IndexError):
+        try:
+            return datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            return None
+
+
+def parse_diff_log(log_content: str) -> list[dict]:
+    """Parse the file diff log content into structured data.
+
+    Pure-Python tokenizer kept deliberately simple; each line is bound and
+    stripped once and the marker checks short-circuit, which is fast enough
+    for the log sizes the harness produces.
+    """
+    phases = []
+    current_phase = None
+    seen_files = {}
+
+    lines = log_content.split('\n')
+    n_lines = len(lines)
+    i = 0
+
+    while i < n_lines:
+        raw = lines[i]
+        line = raw.strip()
+
+        # Look for phase headers
+        if line.startswith(_SEP):
+            i += 1
+            if i < n_lines and 'FILE DIFF' in lines[i]:
+                phase_line = lines[i].strip()
+                phase_match = _PHASE_RE.search(phase_line)
+                if phase_match:
+                    phase_name = phase_match.group(1).lower()
+                    i += 1
+
+                    # Get timestamp
+                    timestamp = None
+                    if i < n_lines:
+                        ts_line = lines[i].strip()
+                        if ts_line.startswith('Timestamp:'):
+                            timestamp = _parse_timestamp(ts_line.removeprefix('Timestamp:').strip())
+                            i += 1
+
+                    # Initialize phase data
+                    current_phase = {
+                        'name': phase_name,
+                        'timestamp': timestamp,
+                        'added_files': [],
+                        'removed_files': [],
+                        'modified_files': [],
+                        'unified_diffs': {}
+                    }
+                    phases.append(current_phase)
+                    seen_files = {'added_files': set(), 'removed_files': set(), 'modified_files': set()}
+                    continue
+
+        # Look for file lists (but don't collect files here - they're listed individually)
+        if current_phase and ('ADDED FILES' in line or 'REMOVED FILES' in line or 'MODIFIED FILES' in line):
+            # Just skip the header line - files are listed individually with ~ prefix
+            pass
+
+        # Look for individual file entries (with +, -, or ~ prefix)
+        if current_phase and raw.startswith('  + '):
+            # This is an added file entry
+            file_path = raw[4:].strip()  # Remove the '  + ' prefix
+            if file_path not in seen_files['added_files']:
+                seen_files['added_files'].add(file_path)
+                current_phase['added_files'].append(file_path)
+        elif current_phase and raw.startswith('  - '):
+            # This is a removed file entry
+            file_path = raw[4:].strip()  # Remove the '  - ' prefix
+            if file_path not in seen_files['removed_files']:
+                seen_files['removed_files'].add(file_path)
+                current_phase['removed_files'].append(file_path)
+        elif current_phase and raw.startswith('  ~ '):
+            # This is a modified file entry
+            file_path = raw[4:].strip()  # Remove the '  ~ ' prefix
+            if file_path not in seen_files['modified_files']:
+                seen_files['modified_files'].add(file_path)
+                current_phase['modified_files'].append(file_path)
+
+        # Look for unified diff sections
+        if current_phase and _UNIFIED_DIFF_MARKER in line:
+            # Extract file path from the line
+            file_path = line.replace(_UNIFIED_DIFF_MARKER, '').strip()
+            # Remove trailing colon if present
+            if file_path.endswith(':'):
+                file_path = file_path[:-1]
+            i += 1
+
+            # Collect diff content until we hit the next file or phase
+            diff_lines = []
+            while i < n_lines:
+                current_line = lines[i]
+                # Stop if we hit another unified diff, phase separator, or file entry
+                # Don't stop at empty lines as they can be part of the diff
+                stripped = current_line.strip()
+                if (_UNIFIED_DIFF_MARKER in current_line or
+                    stripped.startswith(_SEP) or
+                    stripped.startswith(_FILE_LIST_HEADERS) or
+                    current_line.startswith('  ~ ')):
+                    break
+                diff_lines.append(current_line)
+                i += 1
+
+            if diff_lines:
+                current_phase['unified_diffs'][file_path] = '\n'.join(diff_lines)
+
+        i += 1
+
+    return phases
+
+
+_PHASE_FRAGMENT_CACHE: dict = {}
+_PHASE_FRAGMENT_CACHE_MAX = 256
+
+# Fixed-shape phase templates, filled with format_map once per phase
+_PHASE_HEADER_TMPL = """
         <div class="phase">
             <div class="phase-header collapsed" id="{phase_id}-header" onclick="togglePhase('{phase_id}')">
                 <div>
-                    <div class="phase-title">{phase['name'].title()} Phase</div>
-                    <div class="phase-stats">{stats_html}</div>
+                    <div class="phase-title">{title} Phase</div>
+                    <div class="phase-stats">{stats}</div>
                 </div>
-                <div class="collapse-icon">▼</div>
+                <div class="collapse-icon">\u25bc</div>
             </div>
             <div class="phase-content collapsed" id="{phase_id}-content">
 """
 
-        # Add file lists with full content for added/removed files
-        if added_count > 0:
-            html += f"""
+_FILE_LIST_TMPL = """
                 <div class="file-list">
-                    <div class="file-list-title">Added Files ({added_count})</div>
+                    <div class="file-list-title">{label} ({count})</div>
 """
-            for file_path in phase['added_files']:
-                html += f'                    <div class="file-item added">{file_path}</div>\n'
-            html += "                </div>\n"
-
-            # Show full content for added files
-            html += '                <div class="diff-container">\n'
-            for file_path in phase['added_files']:
-                # Clean the file path (remove + prefix if present)
-                clean_file_path = file_path.lstrip('+ ').strip()
-
-                # Get file content from JSON data
-                file_content = get_file_content(json_data, clean_file_path, 'after')
-
-                if file_content is not None:
-                    html += f"""
-                    <div class="diff-header">{file_path} (Added)</div>
-                    <div class="diff-content">
-"""
-                    for line in file_content.split('\n'):
-                        html += f'                        <div class="diff-line added">+{line}</div>\n'
-                    html += "                    </div>\n"
-            html += "                </div>\n"
 
-        if removed_count > 0:
-            html += f"""
-                <div class="file-list">
-                    <div class="file-list-title">Removed Files ({removed_count})</div>
-"""
-            for file_path in phase['removed_files']:
-                html += f'                    <div class="file-item removed">{file_path}</div>\n'
-            html += "                </div>\n"
-
-            # Show full content for removed files
-            html += '                <div class="diff-container">\n'
-            for file_path in phase['removed_files']:
-                # Clean the file path (remove - prefix if present)
-                clean_file_path = file_path.lstrip('- ').strip()
-
-                # Get file content from JSON data
-                file_content = get_file_content(json_data, clean_file_path, 'before')
-
-                if file_content is not None:
-                    html += f"""
-                    <div class="diff-header">{file_path} (Removed)</div>
+_FILE_ITEM_TMPL = '                    <div class="file-item {cls}">{path}</div>\n'
+
+_DIFF_HEADER_TMPL = """
+                    <div class="diff-header">{path} ({kind})</div>
                     <div class="diff-content">
 """
-                    for line in file_content.split('\n'):
-                        html += f'                        <div class="diff-line removed">-{line}</div>\n'
-                    html += "                    </div>\n"
-            html += "                </div>\n"
 
-        if modified_count > 0:
-            html += f"""
-                <div class="file-list">
-                    <div class="file-list-title">Modified Files ({modified_count})</div>
-"""
-            for file_path in phase['modified_files']:
-                html += f'                    <div class="file-item modified">{file_path}</div>\n'
-            html += "                </div>\n"
-
-        # Add unified diffs for modified files only
-        if phase['unified_diffs']:
-            # Filter to only show modified files (not added/removed)
-            # Clean the modified files list for matching
-            clean_modified_files = [f.lstrip('~ ').strip() for f in phase['modified_files']]
-            modified_files_in_diffs = [f for f in phase['unified_diffs'].keys()
-                                     if f in clean_modified_files]
-
-            if modified_files_in_diffs:
-                html += '                <div class="diff-container">\n'
-                for file_path in modified_files_in_diffs:
-                    diff_content = phase['unified_diffs'][file_path]
+
+def _render_phase(phase_id: str, phase: dict, content_index: dict) -> str:
+    """Render one phase section as an HTML fragment."""
+    parts = []
+    # Calculate stats for this phase
+    added_count = len(phase['added_files'])
+    removed_count = len(phase['removed_files'])
+    modified_count = len(phase['modified_files'])
+
+    # Build stats HTML
+    stats_parts = []
+    if added_count > 0:
+        stats_parts.append(f"Files added: {added_count}")
+    if removed_count > 0:
+        stats_parts.append(f"Files removed: {removed_count}")
+    if modified_count > 0:
+        stats_parts.append(f"Files modified: {modified_count}")
+
+    stats_html = " | ".join(stats_parts) if stats_parts else "No changes"
+
+    parts.append(_PHASE_HEADER_TMPL.format_map(
+        {'phase_id': phase_id, 'title': phase['name'].title(), 'stats': stats_html}))
+
+    # Add file lists with full content for added/removed files
+    if added_count > 0:
+        parts.append(_FILE_LIST_TMPL.format_map({'label': 'Added Files', 'count': added_count}))
+        parts.extend(_FILE_ITEM_TMPL.format_map({'cls': 'added', 'path': escape_html(file_path)})
+                     for file_path in phase['added_files'])
+        parts.append("                </div>\n")
+
+        # Show full content for added files
+        parts.append('                <div class="diff-container">\n')
+        for file_path in phase['added_files']:
+            # Parsed paths are already clean; removeprefix only acts on a
+            # stray marker and, unlike lstrip, cannot eat leading path
+            # characters
+            clean_file_path = file_path.removeprefix('+ ')
+
+            # Get file content from the prebuilt index
+            file_content = content_index.get(('after', clean_file_path), "")
+
+            if file_content is not None:
+                parts.append(_DIFF_HEADER_TMPL.format_map(
+                    {'path': escape_html(file_path), 'kind': 'Added'}))
+                # One C-level replace prefixes every line instead of a
+                # Python loop over split('\n')
+                body = escape_html(file_content).replace(
+                    '\n', '</div>\n                        <div class="diff-line added">+')
+                parts.append(f'                        <div class="diff-line added">+{body}</div>\n')
+                parts.append("                    </div>\n")
+        parts.append("                </div>\n")
+
+    if removed_count > 0:
+        parts.append(_FILE_LIST_TMPL.format_map({'label': 'Removed Files', 'count': removed_count}))
+        parts.extend(_FILE_ITEM_TMPL.format_map({'cls': 'removed', 'path': escape_html(file_path)})
+                     for file_path in phase['removed_files'])
+        parts.append("                </div>\n")
+
+        # Show full content for removed files
+        parts.append('                <div class="diff-container">\n')
+        for file_path in phase['removed_files']:
+            clean_file_path = file_path.removeprefix('- ')
+
+            # Get file content from the prebuilt index
+            file_content = content_index.get(('before', clean_file_path), "")
+
+            if file_content is not None:
+                parts.append(_DIFF_HEADER_TMPL.format_map(
+                    {'path': escape_html(file_path), 'kind': 'Removed'}))
+                body = escape_html(file_content).replace(
+                    '\n', '</div>\n                        <div class="diff-line removed">-')
+                parts.append(f'                        <div class="diff-line removed">-{body}</div>\n')
+                parts.append("                    </div>\n")
+        parts.append("                </div>\n")
+
+    if modified_count > 0:
+        parts.append(_FILE_LIST_TMPL.format_map({'label': 'Modified Files', 'count': modified_count}))
+        parts.extend(_FILE_ITEM_TMPL.format_map({'cls': 'modified', 'path': escape_html(file_path)})
+                     for file_path in phase['modified_files'])
+        parts.append("                </div>\n")
+
+    # Add unified diffs for modified files only
+    if phase['unified_diffs']:
+        # Filter to only show modified files (not added/removed)
+        # Clean the modified files list for matching
+        clean_modified_files = [f.removeprefix('~ ') for f in phase['modified_files']]
+        modified_files_in_diffs = [f for f in phase['unified_diffs'].keys()
+                                 if f in clean_modified_files]
+
+        if modified_files_in_diffs:
+            parts.append('                <div class="diff-container">\n')
+            for file_path in modified_files_in_diffs:
+                diff_content = phase['unified_diffs'][file_path]
+                # Skip temporary file headers
+                if file_path.startswith(_TMP_PREFIXES):
+                    continue
+
+                parts.append(_DIFF_HEADER_TMPL.format_map(
+                    {'path': escape_html(file_path), 'kind': 'Modified'}))
+                for line in escape_html(diff_content).split('\n'):
                     # Skip temporary file headers
-                    if file_path.startswith('--- /tmp') or file_path.startswith('+++ /tmp') or '/var/folders' in file_path:
+                    if line.startswith(_TMP_PREFIXES):
                         continue
+                    # Classify by the first character; unified diff markers
+                    # are always in column zero
+                    first = line[:1]
+                    if first == '+' and not line.startswith('+++'):
+                        cls = 'added'
+                    elif first == '-' and not line.startswith('---'):
+                        cls = 'removed'
+                    else:
+                        cls = 'context'
+                    parts.append(f'                        <div class="diff-line {cls}">{line}</div>\n')
+                parts.append("                    </div>\n")
+            parts.append("                </div>\n")
+
+    # Show "no changes" message if nothing happened
+    if added_count == 0 and removed_count == 0 and modified_count == 0:
+        parts.append('                <div class="no-changes">No changes detected in this phase</div>\n')
+
+    parts.append("            </div>\n        </div>\n")
+
+    return ''.join(parts)
+
+
+def _render_phase_fragment(phase_id: str, phase: dict, content_index: dict) -> str:
+    """Render a phase, reusing cached fragments for identical content.
+
+    The key hashes the phase dict plus the file bodies the fragment would
+    pull from the content index, so regenerating a report only re-renders
+    phases that actually changed.
+    """
+    contents = (
+        [content_index.get(('after', p.removeprefix('+ ')), '') for p in phase['added_files']],
+        [content_index.get(('before', p.removeprefix('- ')), '') for p in phase['removed_files']],
+    )
+    payload = json.dumps((phase_id, phase, contents), default=str, sort_keys=True)
+    key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    fragment = _PHASE_FRAGMENT_CACHE.get(key)
+    if fragment is None:
+        fragment = _render_phase(phase_id, phase, content_index)
+        if len(_PHASE_FRAGMENT_CACHE) >= _PHASE_FRAGMENT_CACHE_MAX:
+            _PHASE_FRAGMENT_CACHE.clear()
+        _PHASE_FRAGMENT_CACHE[key] = fragment
+    return fragment
 
-                    html += f"""
-                    <div class="diff-header">{file_path} (Modified)</div>
-                    <div class="diff-content">
-"""
-                    for line in diff_content.split('\n'):
-                        # Skip temporary file headers
-                        if line.startswith('--- /tmp') or line.startswith('+++ /tmp') or '/var/folders' in line:
-                            continue
-                        # Check for added/removed lines (with optional leading spaces)
-                        stripped = line.lstrip()
-                        if stripped.startswith('+') and not stripped.startswith('+++'):
-                            html += f'                        <div class="diff-line added">{line}</div>\n'
-                        elif stripped.startswith('-') and not stripped.startswith('---'):
-                            html += f'                        <div class="diff-line removed">{line}</div>\n'
-                        else:
-                            html += f'                        <div class="diff-line context">{line}</div>\n'
-                    html += "                    </div>\n"
-                html += "                </div>\n"
-
-        # Show "no changes" message if nothing happened
-        if added_count == 0 and removed_count == 0 and modified_count == 0:
-            html += '                <div class="no-changes">No changes detected in this phase</div>\n'
-
-        html += "            </div>\n        </div>\n"
+
+def generate_html(phases: list[dict], task_id: str = None, json_data: dict = None) -> str:
+    """Generate HTML content from parsed diff phases."""
+    content_index = build_content_index(json_data)
+    title_suffix = f" - {task_id}" if task_id else ""
+    parts = [_HTML_HEAD_1, title_suffix, _HTML_HEAD_2, title_suffix, _HTML_HEAD_3]
+
+    # Generate phases
+    for i, phase in enumerate(phases):
+        parts.append(_render_phase_fragment(f"phase-{i}", phase, content_index))
 
         # Add separator between phases (except for the last one)
         if i < len(phases) - 1:
-            html += '        <div class="phase-separator"></div>\n'
+            parts.append('        <div class="phase-separator"></div>\n')
 
-    html += """
+    parts.append("""
     </div>
 </body>
-</html>"""
+</html>""")
 
-    return html
+    return ''.join(parts)
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(log_path_str: str, log_mtime_ns: int, json_path_str: str, json_mtime_ns: int):
+    """Parse a diff log and its sibling JSON, keyed by path and mtime.
+
+    Callers must treat the returned phases and json_data as read-only;
+    they are shared across cache hits.
+    """
+    log_path = Path(log_path_str)
+    with open(log_path, 'r') as f:
+        log_content = f.read()
+
+    phases = parse_diff_log(log_content)
+
+    # The JSON snapshot store is only consulted for added/removed file
+    # contents; skip parsing it (it can be tens of MB) when no phase has any.
+    if any(phase['added_files'] or phase['removed_files'] for phase in phases):
+        json_data = load_diff_json(log_path)
+    else:
+        json_data = {}
+
+    return phases, json_data
 
 
 def render_diff_log_html(diff_log_path: Path, task_id: str = None) -> Path:
@@ -506,17 +645,19 @@ def render_diff_log_html(diff_log_path: Path, task_id: str = None) -> Path:
     if not diff_log_path.exists():
         raise FileNotFoundError(f"Diff log file not found: {diff_log_path}")
 
-    with open(diff_log_path, 'r') as f:
-        log_content = f.read()
-
-    phases = parse_diff_log(log_content)
+    # Parse (or reuse a cached parse) of the log and its sibling JSON
+    json_path = diff_log_path.parent / "file_diffs.json"
+    json_mtime_ns = json_path.stat().st_mtime_ns if json_path.exists() else 0
+    phases, json_data = _parse_cached(
+        str(diff_log_path),
+        diff_log_path.stat().st_mtime_ns,
+        str(json_path),
+        json_mtime_ns,
+    )
 
     if not phases:
         raise ValueError("No diff phases found in the log file.")
 
-    # Load JSON data for full file content
-    json_data = load_diff_json(diff_log_path)
-
     # Generate HTML
     html_content = generate_html(phases, task_id, json_data)
 
@@ -525,18 +666,47 @@ def render_diff_log_html(diff_log_path: Path, task_id: str = None) -> Path:
     return html_content
 
 
+def _render_one(diff_log_path: Path) -> Path:
+    """Render a single diff log and write the HTML next to it.
+
+    Module-level so it can be pickled into worker processes.
+    """
+    html_content = render_diff_log_html(diff_log_path)
+    output_path = diff_log_path.with_suffix('.html')
+    # Encode once and write bytes; text mode would re-encode chunk by chunk
+    output_path.write_bytes(html_content.encode('utf-8'))
+    return output_path
+
+
 if __name__ == "__main__":
     # Simple CLI for testing
     import argparse
+    from concurrent.futures import ProcessPoolExecutor
+
     parser = argparse.ArgumentParser(description="Render file diff logs as HTML")
-    parser.add_argument("diff_log_path", type=Path, help="Path to file_diff_log.txt")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("diff_log_path", type=Path, nargs="?", help="Path to file_diff_log.txt")
+    source.add_argument("--experiment-dir", type=Path,
+                        help="Render every file_diff_log.txt under this directory")
     parser.add_argument("--task-id", help="Task ID for the title")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Worker processes for --experiment-dir mode")
 
     args = parser.parse_args()
 
     try:
-        html_content = render_diff_log_html(args.diff_log_path, args.task_id)
-        print(html_content)  # Output HTML to stdout for CLI usage
+        if args.experiment_dir:
+            diff_logs = find_diff_logs(args.experiment_dir)
+            if not diff_logs:
+                print(f"No file_diff_log.txt files found in {args.experiment_dir}")
+                sys.exit(1)
+            # Parsing and string-building are CPU-bound, so use processes
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                for output_path in executor.map(_render_one, diff_logs):
+                    print(f"Rendered {output_path}")
+        else:
+            html_content = render_diff_log_html(args.diff_log_path, args.task_id)
+            print(html_content)  # Output HTML to stdout for CLI usage
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
\ No newline at end of file
@@ -1,24 +1,24 @@
 #!/usr/bin/env python3
 """Shared utilities for scripts."""
 
-import glob
 import os
-from pathlib import Path
 
 
 def get_latest_experiment_with_results():
     """Find the most recent experiment directory that has results.json."""
-    experiments = glob.glob("experiments/*")
-    if not experiments:
+    try:
+        entries = os.scandir("experiments")
+    except FileNotFoundError:
         return None
-    
-    # Sort by creation time, newest first
-    experiments_sorted = sorted(experiments, key=os.path.getctime, reverse=True)
-    
-    # Find the first one that has results.json
-    for exp in experiments_sorted:
-        results_file = Path(exp) / "results.json"
-        if results_file.exists():
-            return exp
-    
-    return None
+
+    # Single pass over the dirents; is_dir() uses the type info the scan
+    # already fetched and stat() is cached on the entry
+    with entries:
+        latest = max(
+            (e for e in entries
+             if e.is_dir(follow_symlinks=False)
+             and os.path.exists(os.path.join(e.path, "results.json"))),
+            key=lambda e: e.stat().st_ctime,
+            default=None,
+        )
+    return latest.path if latest else None
@@ -0,0 +1,61 @@
+from scripts_python.render_file_diffs import parse_diff_log
+
+SAMPLE_LOG = """============================================================
+FILE DIFF - SETUP PHASE
+Timestamp: 2025-01-01T10:00:00
+ADDED FILES (2):
+  + models/new_model.sql
+  + models/new_model.sql
+  + analyses/report.sql
+REMOVED FILES (1):
+  - models/old_model.sql
+MODIFIED FILES (1):
+  ~ models/changed.sql
+UNIFIED DIFF for models/changed.sql:
+--- a/models/changed.sql
++++ b/models/changed.sql
+@@ -1,2 +1,2 @@
+-select 1
++select 2
+ from t
+"""
+
+
+def test_parse_phase_header_and_timestamp():
+    phases = parse_diff_log(SAMPLE_LOG)
+
+    assert len(phases) == 1
+    phase = phases[0]
+    assert phase["name"] == "setup"
+    assert phase["timestamp"] is not None
+    assert phase["timestamp"].isoformat() == "2025-01-01T10:00:00"
+
+
+def test_parse_file_entries_deduplicated():
+    phase = parse_diff_log(SAMPLE_LOG)[0]
+
+    # The duplicate "+ models/new_model.sql" entry must only appear once
+    assert phase["added_files"] == ["models/new_model.sql", "analyses/report.sql"]
+    assert phase["removed_files"] == ["models/old_model.sql"]
+    assert phase["modified_files"] == ["models/changed.sql"]
+
+
+def test_parse_unified_diff_capture():
+    phase = parse_diff_log(SAMPLE_LOG)[0]
+
+    diff = phase["unified_diffs"]["models/changed.sql"]
+    assert "-select 1" in diff
+    assert "+select 2" in diff
+    assert " from t" in diff
+
+
+def test_parse_invalid_timestamp_is_none():
+    log = SAMPLE_LOG.replace("2025-01-01T10:00:00", "not-a-timestamp")
+    phase = parse_diff_log(log)[0]
+
+    assert phase["name"] == "setup"
+    assert phase["timestamp"] is None
+
+
+def test_parse_empty_log():
+    assert parse_diff_log("") == []